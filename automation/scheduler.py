@@ -21,13 +21,24 @@ import logging
 import asyncio
 import schedule
 import time
+import threading
+import queue
+import atexit
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import json
+import re
 import sqlite3
 from dataclasses import dataclass, asdict
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import wraps
+
+try:
+    import fcntl
+except ImportError:  # Windows: không có flock, bỏ qua khoá
+    fcntl = None
 
 # Add parent directory to path (để import các module gốc)
 ROOT_DIR = Path(__file__).parent.parent
@@ -89,7 +100,7 @@ except ImportError as e:
     GITHUB_AVAILABLE = False
 
 try:
-    from telegram_bot import send_daily_push, TOPIKBot
+    from telegram_bot import send_daily_push, send_message_to_channel, TOPIKBot, BOT_TOKEN
     TELEGRAM_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"⚠️ Không thể import telegram_bot: {e}")
@@ -120,7 +131,7 @@ except ImportError as e:
     ANKI_AVAILABLE = False
 
 try:
-    from seo_optimizer import SEOOptimizer, KeywordResearcher
+    from seo_optimizer import SEOOptimizer, KeywordResearcher, optimize_post_file
     SEO_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"⚠️ Không thể import seo_optimizer: {e}")
@@ -194,6 +205,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TopikScheduler")
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ASYNC RUNTIME
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Một event loop dùng chung chạy trên thread nền, thay cho asyncio.run() mỗi task:
+# tránh dựng/huỷ loop và giữ session HTTPS của Telegram Bot giữa các lần gửi.
+try:
+    import uvloop
+    _LOOP = uvloop.new_event_loop()
+except ImportError:
+    _LOOP = asyncio.new_event_loop()
+
+threading.Thread(target=_LOOP.run_forever, name="scheduler-async-loop", daemon=True).start()
+
+def run_coro(coro) -> Any:
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TASK STATUS TRACKING
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -205,6 +234,9 @@ class TaskStatus(Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
 
+class TaskSkipped(Exception):
+    """Raised by a task that decided not to run (recorded as SKIPPED)."""
+
 @dataclass
 class TaskResult:
     task_name: str
@@ -216,11 +248,28 @@ class TaskResult:
     output_data: Optional[Dict[str, Any]] = None
 
 class TaskTracker:
-    """Track task execution for monitoring and debugging."""
+    """Track task execution for monitoring and debugging.
+    
+    Kết quả được đưa vào hàng đợi và ghi theo lô bởi một thread nền,
+    để run_task không phải chờ INSERT + fsync trên VPS IOPS thấp.
+    """
+    
+    INSERT_SQL = """
+        INSERT INTO task_history 
+        (task_name, status, started_at, completed_at, duration_seconds, error_message, output_data)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    BATCH_SIZE = 32
+    FLUSH_INTERVAL = 5.0  # seconds
+    _STOP = object()
     
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self._init_db()
+        self._queue: queue.Queue = queue.Queue(maxsize=1024)
+        self._thread = threading.Thread(target=self._flush_loop, name="task-tracker-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self._drain)
     
     def _init_db(self):
         with sqlite3.connect(self.db_path) as conn:
@@ -242,21 +291,60 @@ class TaskTracker:
                 ON task_history(task_name, started_at)
             """)
     
+    @staticmethod
+    def _to_row(result: TaskResult) -> tuple:
+        return (
+            result.task_name,
+            result.status.value,
+            result.started_at.isoformat(),
+            result.completed_at.isoformat() if result.completed_at else None,
+            result.duration_seconds,
+            result.error_message,
+            json.dumps(result.output_data) if result.output_data else None
+        )
+    
     def log_task(self, result: TaskResult):
+        row = self._to_row(result)
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            # Hàng đợi đầy: ghi trực tiếp thay vì làm mất kết quả
+            self._write_rows([row])
+    
+    def _write_rows(self, rows: list):
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO task_history 
-                (task_name, status, started_at, completed_at, duration_seconds, error_message, output_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                result.task_name,
-                result.status.value,
-                result.started_at.isoformat(),
-                result.completed_at.isoformat() if result.completed_at else None,
-                result.duration_seconds,
-                result.error_message,
-                json.dumps(result.output_data) if result.output_data else None
-            ))
+            conn.executemany(self.INSERT_SQL, rows)
+    
+    def _flush_loop(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            rows = []
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                rows.append(item)
+                remaining = deadline - time.monotonic()
+                if len(rows) >= self.BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if rows:
+                try:
+                    self._write_rows(rows)
+                except sqlite3.Error as e:
+                    logger.error(f"✗ Failed to write {len(rows)} task results: {e}")
+    
+    def _drain(self):
+        """Flush pending results on interpreter exit."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout=30)
     
     def get_today_tasks(self) -> list:
         today = datetime.now().date().isoformat()
@@ -288,6 +376,11 @@ def run_task(task_name: str, task_func, *args, **kwargs) -> TaskResult:
         result.output_data = output if isinstance(output, dict) else {"result": str(output)}
         logger.info(f"✓ Task completed: {task_name}")
         
+    except TaskSkipped as e:
+        result.status = TaskStatus.SKIPPED
+        result.error_message = str(e)
+        logger.warning(f"○ Task skipped: {task_name} - {e}")
+        
     except Exception as e:
         result.status = TaskStatus.FAILED
         result.error_message = str(e)
@@ -300,10 +393,54 @@ def run_task(task_name: str, task_func, *args, **kwargs) -> TaskResult:
     
     return result
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TASK REGISTRY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# name -> task function (dùng cho run_now)
+TASKS: Dict[str, Callable] = {}
+# (period, at, name) - period là thuộc tính của schedule.every(): "day", "hour", "sunday"...
+SCHEDULE: List[Tuple[str, Optional[str], str]] = []
+
+def register_task(name: str, *, at: Optional[str] = None,
+                  weekly: Optional[Tuple[str, str]] = None, hourly: bool = False):
+    """Register a task for run_now and (optionally) the daemon schedule."""
+    def deco(fn: Callable) -> Callable:
+        TASKS[name] = fn
+        if at:
+            SCHEDULE.append(("day", at, name))
+        if weekly:
+            SCHEDULE.append((weekly[0], weekly[1], name))
+        if hourly:
+            SCHEDULE.append(("hour", None, name))
+        return fn
+    return deco
+
+def single_instance(name: str):
+    """Skip the task if another run (any process) still holds LOG_DIR/{name}.lock."""
+    def deco(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if fcntl is None:
+                return fn(*args, **kwargs)
+            
+            with open(LOG_DIR / f"{name}.lock", "w") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise TaskSkipped(f"{name} đang chạy ở tiến trình khác")
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return wrapper
+    return deco
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DAILY TASKS - TÍCH HỢP VỚI CÁC MODULE HIỆN CÓ
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@register_task("fetch_news", at="04:00")
 def task_fetch_news():
     """Fetch latest TOPIK news - Sử dụng main.py generate_phase_1_news."""
     if MAIN_AVAILABLE:
@@ -311,6 +448,8 @@ def task_fetch_news():
     else:
         raise ImportError("main.py không khả dụng")
 
+@register_task("generate_content", at="04:30")
+@single_instance("generate_content")
 def task_generate_content():
     """Generate daily content - Sử dụng run_full_pipeline từ main.py."""
     if MAIN_AVAILABLE:
@@ -318,6 +457,8 @@ def task_generate_content():
     else:
         raise ImportError("main.py không khả dụng")
 
+@register_task("generate_audio", at="05:00")
+@single_instance("generate_audio")
 def task_generate_audio():
     """Generate TTS audio - Đã được tích hợp trong main.py process_all_assets."""
     if MAIN_AVAILABLE:
@@ -325,6 +466,7 @@ def task_generate_audio():
     else:
         raise ImportError("main.py không khả dụng")
 
+@register_task("trigger_render", at="05:30")
 def task_trigger_render():
     """Trigger video rendering on cloud (GitHub Actions)."""
     import requests
@@ -349,12 +491,14 @@ def task_trigger_render():
     else:
         raise ValueError("GITHUB_TOKEN không được cấu hình")
 
+@register_task("download_videos", at="07:00")
 def task_download_videos():
     """Download rendered videos from cloud storage."""
     # Videos sẽ được tải về thư mục topik-video/out/ bởi GitHub Actions
     video_count = len(list(VIDEO_DIR.glob("*.mp4"))) if VIDEO_DIR.exists() else 0
     return {"video_count": video_count, "path": str(VIDEO_DIR)}
 
+@register_task("upload_tiktok", at="07:30")
 def task_upload_tiktok():
     """Upload videos to TikTok - Sử dụng social_publisher.py."""
     if SOCIAL_AVAILABLE:
@@ -369,6 +513,8 @@ def task_upload_tiktok():
     else:
         raise ImportError("social_publisher.py không khả dụng")
 
+@register_task("upload_youtube", at="08:00")
+@single_instance("upload_youtube")
 def task_upload_youtube():
     """Upload videos to YouTube - Sử dụng youtube_uploader.py."""
     if YOUTUBE_AVAILABLE:
@@ -388,6 +534,7 @@ def task_upload_youtube():
     else:
         raise ImportError("youtube_uploader.py không khả dụng")
 
+@register_task("upload_facebook", at="08:30")
 def task_upload_facebook():
     """Upload videos to Facebook Reels - Sử dụng social_publisher.py."""
     if SOCIAL_AVAILABLE:
@@ -401,6 +548,7 @@ def task_upload_facebook():
     else:
         raise ImportError("social_publisher.py không khả dụng")
 
+@register_task("generate_blog", at="09:00")
 def task_generate_blog():
     """Generate and publish blog post - Sử dụng blog_generator.py."""
     if BLOG_AVAILABLE and GITHUB_AVAILABLE:
@@ -420,6 +568,7 @@ def task_generate_blog():
     else:
         raise ImportError("blog_generator.py hoặc github_deployer.py không khả dụng")
 
+@register_task("generate_podcast", at="09:30")
 def task_generate_podcast():
     """Generate podcast episode - Sử dụng podcast_generator.py."""
     if PODCAST_AVAILABLE:
@@ -432,13 +581,18 @@ def task_generate_podcast():
     else:
         raise ImportError("podcast_generator.py không khả dụng")
 
+@register_task("post_telegram", at="10:00")
 def task_post_telegram():
     """Post to Telegram channel - Sử dụng telegram_bot.py."""
     if TELEGRAM_AVAILABLE:
-        return asyncio.run(send_daily_push())
+        channel_id = os.getenv("TELEGRAM_CHANNEL_ID", "")
+        if not channel_id:
+            raise ValueError("TELEGRAM_CHANNEL_ID không được cấu hình")
+        return run_coro(send_daily_push(BOT_TOKEN, channel_id, str(FINAL_DATA_PATH)))
     else:
         raise ImportError("telegram_bot.py không khả dụng")
 
+@register_task("collect_analytics", at="22:00")
 def task_collect_analytics():
     """Collect analytics from all platforms - Sử dụng monetization.py."""
     if MONETIZATION_AVAILABLE:
@@ -447,6 +601,7 @@ def task_collect_analytics():
     else:
         raise ImportError("monetization.py không khả dụng")
 
+@register_task("generate_report", at="23:00")
 def task_generate_report():
     """Generate daily performance report - Sử dụng monetization.py."""
     if MONETIZATION_AVAILABLE:
@@ -462,6 +617,7 @@ def task_generate_report():
     else:
         raise ImportError("monetization.py không khả dụng")
 
+@register_task("cleanup", at="03:00")
 def task_cleanup_old_files():
     """Clean up files older than 7 days to save disk space."""
     import shutil
@@ -480,14 +636,45 @@ def task_cleanup_old_files():
     
     return {"cleaned_directories": cleaned}
 
+_MEM_RE = re.compile(rb'^(MemAvailable|MemTotal):\s+(\d+)', re.M)
+
+def _memory_percent() -> float:
+    """Memory usage from /proc/meminfo (falls back to psutil off Linux)."""
+    try:
+        with open("/proc/meminfo", "rb") as f:
+            fields = dict(_MEM_RE.findall(f.read()))
+        return round(100 * (1 - int(fields[b"MemAvailable"]) / int(fields[b"MemTotal"])), 1)
+    except (OSError, KeyError):
+        import psutil
+        return psutil.virtual_memory().percent
+
+def _disk_percent(path: str = "/") -> float:
+    """Disk usage from statvfs, same formula as psutil (shutil.disk_usage off Unix)."""
+    try:
+        s = os.statvfs(path)
+        used = s.f_blocks - s.f_bfree
+        total = used + s.f_bavail  # root-reserved blocks excluded, as psutil does
+    except AttributeError:
+        import shutil
+        usage = shutil.disk_usage(path)
+        used, total = usage.used, usage.used + usage.free
+    return round(100 * used / total, 1) if total else 0.0
+
+def _cpu_percent() -> float:
+    """1-minute load average relative to the core count (psutil off Unix)."""
+    try:
+        return round(100 * os.getloadavg()[0] / (os.cpu_count() or 1), 1)
+    except (AttributeError, OSError):
+        import psutil
+        return psutil.cpu_percent()
+
+@register_task("health_check", hourly=True)
 def task_health_check():
     """Check system health and notify if issues."""
-    import psutil
-    
     health = {
-        "cpu_percent": psutil.cpu_percent(),
-        "memory_percent": psutil.virtual_memory().percent,
-        "disk_percent": psutil.disk_usage('/').percent,
+        "cpu_percent": _cpu_percent(),
+        "memory_percent": _memory_percent(),
+        "disk_percent": _disk_percent("/"),
         "status": "healthy"
     }
     
@@ -505,6 +692,7 @@ def task_health_check():
 # PROFESSIONAL REVENUE TASKS - Các task kiếm tiền chuyên nghiệp
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@register_task("send_daily_email", at="10:30")
 def task_send_daily_email():
     """Send daily email to subscribers - email_marketing.py."""
     if EMAIL_MARKETING_AVAILABLE:
@@ -518,6 +706,7 @@ def task_send_daily_email():
     else:
         raise ImportError("email_marketing.py không khả dụng")
 
+@register_task("generate_anki_deck", at="11:00")
 def task_generate_anki_deck():
     """Generate weekly Anki deck for sale - anki_generator.py."""
     if ANKI_AVAILABLE:
@@ -538,6 +727,7 @@ def task_generate_anki_deck():
     else:
         raise ImportError("anki_generator.py không khả dụng")
 
+@register_task("optimize_seo", at="11:30")
 def task_optimize_seo():
     """Optimize blog SEO - seo_optimizer.py."""
     if SEO_AVAILABLE and BLOG_AVAILABLE:
@@ -545,28 +735,24 @@ def task_optimize_seo():
         
         blog_dir = BASE_DIR / "blog" / "_posts"
         if blog_dir.exists():
-            optimized = 0
-            for post_file in blog_dir.glob("*.md"):
-                with open(post_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                # Optimize content
-                optimized_content = optimizer.optimize_content(content)
-                
-                with open(post_file, "w", encoding="utf-8") as f:
-                    f.write(optimized_content)
-                
-                optimized += 1
+            post_files = [str(p) for p in blog_dir.glob("*.md")]
+            
+            # Phân tích song song: process pool khi có nhiều core, thread pool trên VPS 1vCPU
+            workers = os.cpu_count() or 1
+            executor_cls = ProcessPoolExecutor if workers > 1 else ThreadPoolExecutor
+            with executor_cls(max_workers=workers) as pool:
+                reports = list(pool.map(optimize_post_file, post_files))
             
             # Generate sitemap
             optimizer.generate_sitemap(str(blog_dir.parent))
             
-            return {"optimized_posts": optimized}
+            return {"optimized_posts": len(reports), "reports": reports}
         else:
             return {"optimized_posts": 0, "note": "Blog directory not found"}
     else:
         raise ImportError("seo_optimizer.py hoặc blog_generator.py không khả dụng")
 
+@register_task("collect_platform_analytics", at="21:00")
 def task_collect_platform_analytics():
     """Collect analytics from all platforms - analytics_dashboard.py."""
     if ANALYTICS_AVAILABLE:
@@ -584,6 +770,7 @@ def task_collect_platform_analytics():
     else:
         raise ImportError("analytics_dashboard.py không khả dụng")
 
+@register_task("generate_revenue_report", at="23:30")
 def task_generate_revenue_report():
     """Generate daily revenue report - analytics_dashboard.py."""
     if ANALYTICS_AVAILABLE:
@@ -599,6 +786,7 @@ def task_generate_revenue_report():
     else:
         raise ImportError("analytics_dashboard.py không khả dụng")
 
+@register_task("update_affiliate_links", at="12:00")
 def task_update_affiliate_links():
     """Insert affiliate links into new content - affiliate_manager.py."""
     if AFFILIATE_AVAILABLE and BLOG_AVAILABLE:
@@ -628,6 +816,7 @@ def task_update_affiliate_links():
     else:
         raise ImportError("affiliate_manager.py hoặc blog_generator.py không khả dụng")
 
+@register_task("post_community_daily", at="12:30")
 def task_post_community_daily():
     """Post daily content to Discord/Telegram community - community_manager.py."""
     if COMMUNITY_AVAILABLE:
@@ -641,8 +830,7 @@ def task_post_community_daily():
             
             # Post to Telegram if available
             if TELEGRAM_AVAILABLE:
-                from telegram_bot import send_message_to_channel
-                asyncio.run(send_message_to_channel(daily_content))
+                run_coro(send_message_to_channel(daily_content))
             
             return {"content_posted": True}
         else:
@@ -650,6 +838,8 @@ def task_post_community_daily():
     else:
         raise ImportError("community_manager.py không khả dụng")
 
+@register_task("generate_weekly_anki", weekly=("sunday", "14:00"))
+@single_instance("generate_weekly_anki")
 def task_generate_weekly_anki():
     """Generate weekly premium Anki deck (Sundays) - anki_generator.py."""
     if ANKI_AVAILABLE:
@@ -688,44 +878,13 @@ def task_generate_weekly_anki():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def setup_schedule():
-    """Configure the daily schedule."""
-    
-    # Morning content pipeline (Vietnam timezone UTC+7)
-    schedule.every().day.at("04:00").do(lambda: run_task("fetch_news", task_fetch_news))
-    schedule.every().day.at("04:30").do(lambda: run_task("generate_content", task_generate_content))
-    schedule.every().day.at("05:00").do(lambda: run_task("generate_audio", task_generate_audio))
-    schedule.every().day.at("05:30").do(lambda: run_task("trigger_render", task_trigger_render))
-    
-    # Video download and upload
-    schedule.every().day.at("07:00").do(lambda: run_task("download_videos", task_download_videos))
-    schedule.every().day.at("07:30").do(lambda: run_task("upload_tiktok", task_upload_tiktok))
-    schedule.every().day.at("08:00").do(lambda: run_task("upload_youtube", task_upload_youtube))
-    schedule.every().day.at("08:30").do(lambda: run_task("upload_facebook", task_upload_facebook))
-    
-    # Content distribution
-    schedule.every().day.at("09:00").do(lambda: run_task("generate_blog", task_generate_blog))
-    schedule.every().day.at("09:30").do(lambda: run_task("generate_podcast", task_generate_podcast))
-    schedule.every().day.at("10:00").do(lambda: run_task("post_telegram", task_post_telegram))
+    """Configure the daily schedule (Vietnam timezone UTC+7) from the task registry."""
     
-    # Professional revenue tasks - Các task kiếm tiền
-    schedule.every().day.at("10:30").do(lambda: run_task("send_daily_email", task_send_daily_email))
-    schedule.every().day.at("11:00").do(lambda: run_task("generate_anki_deck", task_generate_anki_deck))
-    schedule.every().day.at("11:30").do(lambda: run_task("optimize_seo", task_optimize_seo))
-    schedule.every().day.at("12:00").do(lambda: run_task("update_affiliate_links", task_update_affiliate_links))
-    schedule.every().day.at("12:30").do(lambda: run_task("post_community_daily", task_post_community_daily))
-    
-    # Weekly premium content (Sunday only)
-    schedule.every().sunday.at("14:00").do(lambda: run_task("generate_weekly_anki", task_generate_weekly_anki))
-    
-    # Evening analytics
-    schedule.every().day.at("21:00").do(lambda: run_task("collect_platform_analytics", task_collect_platform_analytics))
-    schedule.every().day.at("22:00").do(lambda: run_task("collect_analytics", task_collect_analytics))
-    schedule.every().day.at("23:00").do(lambda: run_task("generate_report", task_generate_report))
-    schedule.every().day.at("23:30").do(lambda: run_task("generate_revenue_report", task_generate_revenue_report))
-    
-    # Maintenance
-    schedule.every().day.at("03:00").do(lambda: run_task("cleanup", task_cleanup_old_files))
-    schedule.every().hour.do(lambda: run_task("health_check", task_health_check))
+    for period, at, name in SCHEDULE:
+        job = getattr(schedule.every(), period)
+        if at:
+            job = job.at(at)
+        job.do(run_task, name, TASKS[name])
     
     logger.info("📅 Schedule configured successfully")
     logger.info("💰 Professional revenue tasks enabled: email, anki, seo, affiliate, community")
@@ -734,54 +893,52 @@ def setup_schedule():
 # MAIN ENTRY POINT
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Thứ tự pipeline dựng một lần lúc import: bước chuẩn bị phải chạy tuần tự,
+# các bước phân phối nội dung độc lập với nhau nên có thể chạy song song.
+PIPELINE_PREREQUISITES: Tuple[Tuple[str, Callable], ...] = tuple(
+    (name, TASKS[name]) for name in (
+        "fetch_news", "generate_content", "generate_audio",
+        "trigger_render", "download_videos",
+    )
+)
+PIPELINE_DISTRIBUTION: Tuple[Tuple[str, Callable], ...] = tuple(
+    (name, TASKS[name]) for name in (
+        "upload_tiktok", "upload_youtube", "upload_facebook",
+        "generate_blog", "generate_podcast", "post_telegram",
+    )
+)
+PIPELINE: Tuple[Tuple[str, Callable], ...] = PIPELINE_PREREQUISITES + PIPELINE_DISTRIBUTION
+
+def run_pipeline(stages: Tuple[Tuple[str, Callable], ...] = PIPELINE) -> List[TaskResult]:
+    """Run stages in order, stopping at the first failure."""
+    results = []
+    for name, fn in stages:
+        result = run_task(name, fn)
+        results.append(result)
+        if result.status is TaskStatus.FAILED:
+            logger.error(f"Pipeline stopped at {name}")
+            break
+    return results
+
+async def run_pipeline_async() -> List[TaskResult]:
+    """Run prerequisites sequentially, then all distribution tasks concurrently."""
+    results = await asyncio.to_thread(run_pipeline, PIPELINE_PREREQUISITES)
+    if results and results[-1].status is TaskStatus.FAILED:
+        return results
+    
+    results.extend(await asyncio.gather(
+        *(asyncio.to_thread(run_task, name, fn) for name, fn in PIPELINE_DISTRIBUTION)
+    ))
+    return results
+
 def run_now(task_name: str):
     """Run a specific task immediately."""
-    tasks = {
-        # Content pipeline
-        "fetch_news": task_fetch_news,
-        "generate_content": task_generate_content,
-        "generate_audio": task_generate_audio,
-        "trigger_render": task_trigger_render,
-        "download_videos": task_download_videos,
-        "upload_tiktok": task_upload_tiktok,
-        "upload_youtube": task_upload_youtube,
-        "upload_facebook": task_upload_facebook,
-        "generate_blog": task_generate_blog,
-        "generate_podcast": task_generate_podcast,
-        "post_telegram": task_post_telegram,
-        "collect_analytics": task_collect_analytics,
-        "generate_report": task_generate_report,
-        "cleanup": task_cleanup_old_files,
-        "health_check": task_health_check,
-        # Professional revenue tasks
-        "send_daily_email": task_send_daily_email,
-        "generate_anki_deck": task_generate_anki_deck,
-        "optimize_seo": task_optimize_seo,
-        "update_affiliate_links": task_update_affiliate_links,
-        "post_community_daily": task_post_community_daily,
-        "collect_platform_analytics": task_collect_platform_analytics,
-        "generate_revenue_report": task_generate_revenue_report,
-        "generate_weekly_anki": task_generate_weekly_anki,
-    }
-    
-    if task_name in tasks:
-        return run_task(task_name, tasks[task_name])
+    if task_name in TASKS:
+        return run_task(task_name, TASKS[task_name])
     elif task_name == "all":
-        # Run full pipeline
-        pipeline = [
-            "fetch_news", "generate_content", "generate_audio", 
-            "trigger_render", "download_videos", 
-            "upload_tiktok", "upload_youtube", "upload_facebook",
-            "generate_blog", "generate_podcast", "post_telegram"
-        ]
-        results = []
-        for t in pipeline:
-            result = run_task(t, tasks[t])
-            results.append(result)
-            if result.status == TaskStatus.FAILED:
-                logger.error(f"Pipeline stopped at {t}")
-                break
-        return results
+        return run_pipeline()
+    elif task_name == "all_parallel":
+        return run_coro(run_pipeline_async())
     else:
         logger.error(f"Unknown task: {task_name}")
         return None
@@ -823,7 +980,9 @@ def main():
         
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Ngủ đến job kế tiếp thay vì thức dậy mỗi phút (tối đa 1 giờ)
+            idle = schedule.idle_seconds()
+            time.sleep(min(max(idle, 1), 3600) if idle is not None else 3600)
     
     else:
         parser.print_help()
@@ -12,99 +12,231 @@ Features:
 
 import os
 import json
+import hashlib
 import logging
 import re
-from datetime import datetime
-from typing import Dict, List, Optional
-import shutil
+import time
+from typing import Dict, List, Optional, Tuple, Union
+from bisect import insort
+from operator import itemgetter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from markupsafe import Markup, escape
+
+# orjson parses raw bytes directly; stdlib json.loads also accepts bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # ==================== CONFIGURATION ====================
 BLOG_OUTPUT_DIR = "blog_output"
 BLOG_POSTS_DIR = os.path.join(BLOG_OUTPUT_DIR, "posts")
 BLOG_ASSETS_DIR = os.path.join(BLOG_OUTPUT_DIR, "assets")
+POSTS_INDEX_FILE = "posts_index.json"  # Manifest of generated posts (date order), inside the output dir
+CSS_HASH_FILE = ".css.hash"  # Sidecar digests: skip rewriting unchanged style.css / index.html
+INDEX_HASH_FILE = ".index.hash"
+JINJA_CACHE_DIR = os.getenv("BLOG_JINJA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "topik_jinja"))
+
+# Frontmatter tags are the same for every post — serialize once
+_TAGS_JSON = json.dumps(["TOPIK", "Korean", "Learning", "Quiz"], ensure_ascii=False)
 
 # ==================== TEMPLATES ====================
 
 BLOG_POST_TEMPLATE = """---
-title: "{title}"
-date: "{date}"
-topic: "{topic}"
-tags: {tags}
-description: "{description}"
+title: "{{ title }}"
+date: "{{ date }}"
+topic: "{{ topic }}"
+tags: {{ tags }}
+description: "{{ description }}"
 lang: "vi"
 ---
 
-# {title}
+# {{ title }}
 
-📅 **Ngày**: {date}  
-🏷️ **Chủ đề**: {topic}
+📅 **Ngày**: {{ date }}  
+🏷️ **Chủ đề**: {{ topic }}
 
 ---
 
 ## 📰 Tin Tức Hôm Nay
 
 ### 🇰🇷 Tiếng Hàn
-{news_kr}
+{{ news_kr }}
 
 ### 🇻🇳 Tiếng Việt
-{news_vi}
+{{ news_vi }}
 
 ---
 
 ## 📝 Đề Thi TOPIK 54
 
 ### Yêu cầu đề bài:
-{question}
+{{ question }}
 
 ---
 
 ## ✍️ Bài Văn Mẫu
 
-{essay}
+{{ essay }}
 
 ---
 
 ## 📊 Phân Tích Theo Đoạn
 
-{paragraphs_analysis}
+{{ paragraphs_analysis }}
 
 ---
 
 ## 📚 Từ Vựng & Ngữ Pháp Quan Trọng
 
-{vocabulary_section}
+{{ vocabulary_section }}
 
 ---
 
 ## 🎯 Quiz Hôm Nay
 
 ### Quiz Từ Vựng
-{vocab_quiz}
+{{ vocab_quiz }}
 
 ### Quiz Ngữ Pháp
-{grammar_quiz}
+{{ grammar_quiz }}
 
 ---
 
 ## 🎬 Video Học Tập
 
-- [TikTok Video 1 - Tin Tức]({video_1_url})
-- [TikTok Video 2 - Bài Văn Mẫu]({video_2_url})
-- [TikTok Video 3 - Quiz Từ Vựng]({video_3_url})
-- [TikTok Video 4 - Quiz Ngữ Pháp]({video_4_url})
-- [YouTube Deep Dive]({video_5_url})
+- [TikTok Video 1 - Tin Tức]({{ video_1_url }})
+- [TikTok Video 2 - Bài Văn Mẫu]({{ video_2_url }})
+- [TikTok Video 3 - Quiz Từ Vựng]({{ video_3_url }})
+- [TikTok Video 4 - Quiz Ngữ Pháp]({{ video_4_url }})
+- [YouTube Deep Dive]({{ video_5_url }})
 
 ---
 
 ## 🎧 Podcast
 
-Nghe bài học hôm nay trên [Spotify]({spotify_url})
+Nghe bài học hôm nay trên [Spotify]({{ spotify_url }})
 
 ---
 
 *Được tạo tự động bởi TOPIK Daily System*
 """
 
+BLOG_POST_HTML_TEMPLATE = """{% autoescape true %}
+{% macro quiz_section(quiz) %}
+{% if quiz %}
+<div class="quiz-section">
+<p><strong>Từ khóa:</strong> <code>{{ quiz.target_word or quiz.target_grammar }}</code></p>
+<p><strong>Câu hỏi:</strong> {{ quiz.question_vi }}</p>
+<ul>
+{% for opt in quiz.options_vi or [] %}
+<li>{{ opt }}</li>
+{% endfor %}
+</ul>
+<details>
+<summary>👁️ Xem đáp án</summary>
+<p><strong>Đáp án đúng: {{ quiz.correct_answer }}</strong></p>
+{{ quiz.explanation_vi | paragraphs }}
+</details>
+</div>
+{% else %}
+<p><em>Không có quiz</em></p>
+{% endif %}
+{% endmacro %}
+<!DOCTYPE html>
+<html lang="vi">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <meta name="description" content="{{ description }}">
+    <link rel="stylesheet" href="../style.css">
+    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;700&display=swap" rel="stylesheet">
+</head>
+<body>
+    <header>
+        <h1><a href="../index.html" style="color:white;text-decoration:none;">🇰🇷 TOPIK Daily</a></h1>
+    </header>
+    
+    <article class="post">
+<h1>{{ title }}</h1>
+<p>📅 <strong>Ngày</strong>: {{ date }}<br>🏷️ <strong>Chủ đề</strong>: {{ topic }}</p>
+<hr>
+<h2>📰 Tin Tức Hôm Nay</h2>
+<h3>🇰🇷 Tiếng Hàn</h3>
+{{ news_kr | paragraphs }}
+<h3>🇻🇳 Tiếng Việt</h3>
+{{ news_vi | paragraphs }}
+<hr>
+<h2>📝 Đề Thi TOPIK 54</h2>
+<h3>Yêu cầu đề bài:</h3>
+{{ question | paragraphs }}
+<hr>
+<h2>✍️ Bài Văn Mẫu</h2>
+{{ essay | paragraphs }}
+<hr>
+<h2>📊 Phân Tích Theo Đoạn</h2>
+{% for para in paragraphs %}
+<h3>{{ para.label }}</h3>
+<p><strong>🇰🇷 Tiếng Hàn:</strong></p>
+<blockquote>{{ para.ko }}</blockquote>
+<p><strong>🇻🇳 Tiếng Việt:</strong></p>
+<blockquote>{{ para.vi }}</blockquote>
+<p><strong>📊 Phân tích:</strong></p>
+{{ para.analysis_vi | paragraphs }}
+{% else %}
+<p><em>Không có phân tích</em></p>
+{% endfor %}
+<hr>
+<h2>📚 Từ Vựng &amp; Ngữ Pháp Quan Trọng</h2>
+{% for item in vocabulary %}
+<div class="vocab-item">
+<strong class="korean-text">{{ loop.index }}. {{ item.item }}</strong>
+{{ item.professor_explanation | paragraphs }}
+</div>
+{% else %}
+<p><em>Không có từ vựng hôm nay</em></p>
+{% endfor %}
+<hr>
+<h2>🎯 Quiz Hôm Nay</h2>
+<h3>Quiz Từ Vựng</h3>
+{{ quiz_section(vocab_quiz_data) }}
+<h3>Quiz Ngữ Pháp</h3>
+{{ quiz_section(grammar_quiz_data) }}
+<hr>
+<h2>🎬 Video Học Tập</h2>
+<ul>
+<li><a href="{{ video_1_url }}">TikTok Video 1 - Tin Tức</a></li>
+<li><a href="{{ video_2_url }}">TikTok Video 2 - Bài Văn Mẫu</a></li>
+<li><a href="{{ video_3_url }}">TikTok Video 3 - Quiz Từ Vựng</a></li>
+<li><a href="{{ video_4_url }}">TikTok Video 4 - Quiz Ngữ Pháp</a></li>
+<li><a href="{{ video_5_url }}">YouTube Deep Dive</a></li>
+</ul>
+<hr>
+<h2>🎧 Podcast</h2>
+<p>Nghe bài học hôm nay trên <a href="{{ spotify_url }}">Spotify</a></p>
+<hr>
+<p><em>Được tạo tự động bởi TOPIK Daily System</em></p>
+    </article>
+    
+    <footer>
+        <p><a href="../index.html">← Quay lại trang chủ</a></p>
+        <p>© 2026 TOPIK Daily</p>
+    </footer>
+</body>
+</html>
+{% endautoescape %}"""
+
 INDEX_TEMPLATE = """<!DOCTYPE html>
 <html lang="vi">
 <head>
@@ -122,7 +254,7 @@ INDEX_TEMPLATE = """<!DOCTYPE html>
     
     <main>
         <section class="posts">
-            {posts_list}
+            {{ posts_list }}
         </section>
     </main>
     
@@ -135,11 +267,11 @@ INDEX_TEMPLATE = """<!DOCTYPE html>
 
 POST_CARD_TEMPLATE = """
         <article class="post-card">
-            <h2><a href="posts/{slug}.html">{title}</a></h2>
-            <p class="date">📅 {date}</p>
-            <p class="topic">🏷️ {topic}</p>
-            <p class="excerpt">{excerpt}</p>
-            <a href="posts/{slug}.html" class="read-more">Đọc tiếp →</a>
+            <h2><a href="posts/{{ slug }}.html">{{ title }}</a></h2>
+            <p class="date">📅 {{ date }}</p>
+            <p class="topic">🏷️ {{ topic }}</p>
+            <p class="excerpt">{{ excerpt }}</p>
+            <a href="posts/{{ slug }}.html" class="read-more">Đọc tiếp →</a>
         </article>
 """
 
@@ -315,6 +447,111 @@ article.post blockquote {
 }
 """
 
+# Inline Markdown the content generator emits inside plain-text fields.
+# Applied after escaping, so the captured text is already HTML-safe.
+_INLINE_MD_RE = re.compile(
+    r'\*\*(?P<bold>.+?)\*\*'
+    r'|\*(?P<em>.+?)\*'
+    r'|`(?P<code>.+?)`'
+    r'|\[(?P<text>.+?)\]\((?P<href>.+?)\)'
+)
+
+
+def _inline_md_sub(m: re.Match) -> str:
+    """Render one inline Markdown match (dispatch on the group that matched)"""
+    kind = m.lastgroup
+    if kind == "bold":
+        return f"<strong>{_INLINE_MD_RE.sub(_inline_md_sub, m.group('bold'))}</strong>"
+    if kind == "em":
+        return f"<em>{_INLINE_MD_RE.sub(_inline_md_sub, m.group('em'))}</em>"
+    if kind == "code":
+        return f"<code>{m.group('code')}</code>"
+    return f'<a href="{m.group("href")}">{_INLINE_MD_RE.sub(_inline_md_sub, m.group("text"))}</a>'
+
+
+def _html_paragraphs(text) -> Markup:
+    """Escape plain text, render inline Markdown, split into <p> (blank line) and <br> (newline)"""
+    blocks = [b.strip("\n") for b in str(text or "").split("\n\n") if b.strip()]
+    return Markup("".join(
+        "<p>" + _INLINE_MD_RE.sub(_inline_md_sub, str(escape(b))).replace("\n", "<br>") + "</p>"
+        for b in blocks
+    ))
+
+
+# Templates are compiled once at import and rendered many times.
+# autoescape stays off for the Markdown templates (Markdown with embedded HTML
+# fragments); BLOG_POST_HTML_TEMPLATE turns it on with {% autoescape true %}.
+# Compiled bytecode is cached on disk so daily cron runs skip lexing/parsing;
+# Jinja only consults the cache for loader templates, hence DictLoader.
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    try:
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+
+_ENV = Environment(
+    loader=DictLoader({
+        "post.md": BLOG_POST_TEMPLATE,
+        "post.html": BLOG_POST_HTML_TEMPLATE,
+        "index.html": INDEX_TEMPLATE,
+        "card.html": POST_CARD_TEMPLATE,
+    }),
+    bytecode_cache=_bytecode_cache(),
+    autoescape=False,
+    keep_trailing_newline=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_ENV.filters["paragraphs"] = _html_paragraphs
+_POST_TMPL = _ENV.get_template("post.md")
+_POST_HTML_TMPL = _ENV.get_template("post.html")
+_INDEX_TMPL = _ENV.get_template("index.html")
+_CARD_TMPL = _ENV.get_template("card.html")
+
+def _digest(text: str) -> str:
+    """Short blake2b hex digest used for write-if-changed guards"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# Changing a template invalidates every cached post in posts_index.json
+_TEMPLATE_HASH = _digest(BLOG_POST_TEMPLATE + BLOG_POST_HTML_TEMPLATE + CSS_TEMPLATE)
+_CSS_HASH = _digest(CSS_TEMPLATE)
+
+# Markdown block for one essay paragraph (format_map over a defaultdict(str))
+_PARA_TMPL = """
+### {label}
+
+**🇰🇷 Tiếng Hàn:**
+> {ko}
+
+**🇻🇳 Tiếng Việt:**
+> {vi}
+
+**📊 Phân tích:**
+{analysis_vi}
+"""
+
+# Slug: strip everything except word chars, spaces, Korean/Vietnamese letters and dashes
+_SLUG_STRIP_RE = re.compile(r'[^\w\s가-힣àáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ-]')
+_SLUG_WS_RE = re.compile(r'\s+')
+
+def _write_if_changed(path: str, content: Union[str, bytes]) -> bool:
+    """Write content in one shot; skip if the file already holds the same bytes"""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
 
 class BlogGenerator:
     """Generate blog posts from TOPIK final_data.json"""
@@ -323,66 +560,48 @@ class BlogGenerator:
         self.output_dir = output_dir
         self.posts_dir = os.path.join(output_dir, "posts")
         self.assets_dir = os.path.join(output_dir, "assets")
-        self.posts_data = []
+        self.posts_data = []  # Kept sorted by date (ascending) via add_post
         
     def setup_directories(self):
         """Create necessary directories"""
         os.makedirs(self.posts_dir, exist_ok=True)
         os.makedirs(self.assets_dir, exist_ok=True)
-        logging.info(f"📁 Blog directories created: {self.output_dir}")
+        logging.info("📁 Blog directories created: %s", self.output_dir)
         
     def generate_slug(self, title: str, date: str) -> str:
         """Generate URL-friendly slug"""
         # Remove special characters, keep Korean/Vietnamese
-        slug = re.sub(r'[^\w\s가-힣àáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ-]', '', title.lower())
-        slug = re.sub(r'\s+', '-', slug)
-        slug = slug[:50]  # Limit length
-        return f"{date}-{slug}"
+        slug = _SLUG_STRIP_RE.sub('', title.lower())
+        slug = _SLUG_WS_RE.sub('-', slug)
+        slug = slug[:40]  # Limit length
+        # Short hash of the full title: topics sharing a long prefix get distinct slugs
+        suffix = _digest(title)[:6]
+        return f"{date}-{slug}-{suffix}"
     
     def format_vocabulary(self, analysis_list: List[Dict]) -> str:
         """Format vocabulary section"""
-        if not analysis_list:
+        items = (analysis_list or [])[:15]  # Limit to 15 items
+        if not items:
             return "*Không có từ vựng hôm nay*"
         
-        sections = []
-        for i, item in enumerate(analysis_list[:15], 1):  # Limit to 15 items
-            word = item.get("item", "")
-            explanation = item.get("professor_explanation", "")
-            sections.append(f"""
+        _get = dict.get
+        return "\n".join(
+            f"""
 <div class="vocab-item">
-<strong class="korean-text">{i}. {word}</strong>
+<strong class="korean-text">{i}. {_get(item, "item", "")}</strong>
 
-{explanation}
+{_get(item, "professor_explanation", "")}
 </div>
-""")
-        return "\n".join(sections)
+"""
+            for i, item in enumerate(items, 1)
+        )
     
     def format_paragraphs(self, paragraphs: List[Dict]) -> str:
         """Format essay paragraphs analysis"""
         if not paragraphs:
             return "*Không có phân tích*"
         
-        sections = []
-        for para in paragraphs:
-            label = para.get("label", "")
-            ko = para.get("ko", "")
-            vi = para.get("vi", "")
-            analysis_ko = para.get("analysis_ko", "")
-            analysis_vi = para.get("analysis_vi", "")
-            
-            sections.append(f"""
-### {label}
-
-**🇰🇷 Tiếng Hàn:**
-> {ko}
-
-**🇻🇳 Tiếng Việt:**
-> {vi}
-
-**📊 Phân tích:**
-{analysis_vi}
-""")
-        return "\n".join(sections)
+        return "\n".join(_PARA_TMPL.format_map(defaultdict(str, para)) for para in paragraphs)
     
     def format_quiz(self, quiz_data: Dict, quiz_type: str = "vocab") -> str:
         """Format quiz section"""
@@ -422,7 +641,7 @@ class BlogGenerator:
     def generate_post(self, data: Dict, date: str = None) -> Dict:
         """Generate a single blog post from final_data.json"""
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = time.strftime("%Y-%m-%d")
         
         # Extract data
         meta = data.get("meta", {})
@@ -445,7 +664,7 @@ class BlogGenerator:
         essay = phase2.get("essay", "")
         
         # Get analysis
-        analysis_list = phase2.get("analysis_list", [])
+        analysis_list = phase2.get("analysis_list") or []
         
         # Get Deep Dive data
         deep_dive = phase4.get("video_5_deep_dive", phase3.get("video_5_deep_dive", {}))
@@ -465,12 +684,12 @@ class BlogGenerator:
         vocab_quiz_html = self.format_quiz(vocab_quiz, "vocab")
         grammar_quiz_html = self.format_quiz(grammar_quiz, "grammar")
         
-        # Generate markdown
-        content = BLOG_POST_TEMPLATE.format(
+        # Markdown and HTML are rendered from the same context
+        context = dict(
             title=title,
             date=date,
             topic=topic,
-            tags=json.dumps(["TOPIK", "Korean", "Learning", "Quiz"], ensure_ascii=False),
+            tags=_TAGS_JSON,
             description=f"Học TOPIK với chủ đề: {topic}",
             news_kr=news_kr,
             news_vi=news_vi,
@@ -480,6 +699,10 @@ class BlogGenerator:
             vocabulary_section=vocabulary_section,
             vocab_quiz=vocab_quiz_html,
             grammar_quiz=grammar_quiz_html,
+            paragraphs=paragraphs,
+            vocabulary=analysis_list[:15],
+            vocab_quiz_data=vocab_quiz,
+            grammar_quiz_data=grammar_quiz,
             video_1_url="#",
             video_2_url="#",
             video_3_url="#",
@@ -487,17 +710,19 @@ class BlogGenerator:
             video_5_url="#",
             spotify_url="#"
         )
+        content = _POST_TMPL.render(context)
+        html_content = _POST_HTML_TMPL.render(context)
         
         # Save markdown
         md_path = os.path.join(self.posts_dir, f"{slug}.md")
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        _write_if_changed(md_path, content)
         
-        # Convert to HTML
-        html_content = self.markdown_to_html(content, title)
+        # Save HTML
         html_path = os.path.join(self.posts_dir, f"{slug}.html")
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        if not _write_if_changed(html_path, html_content):
+            # Same bytes, write skipped: still bump the mtime, or generate_from_json's
+            # "HTML newer than JSON" check never passes again after a same-content rewrite
+            os.utime(html_path)
         
         post_info = {
             "title": title,
@@ -509,108 +734,147 @@ class BlogGenerator:
             "html_path": html_path
         }
         
-        self.posts_data.append(post_info)
-        logging.info(f"✅ Blog post generated: {slug}")
+        self.add_post(post_info)
+        logging.info("✅ Blog post generated: %s", slug)
         
         return post_info
     
-    def markdown_to_html(self, markdown_content: str, title: str) -> str:
-        """Convert markdown to HTML (simple conversion)"""
-        # Remove frontmatter
-        content = re.sub(r'^---[\s\S]*?---\n', '', markdown_content)
-        
-        # Convert headers
-        content = re.sub(r'^### (.+)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-        content = re.sub(r'^## (.+)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-        content = re.sub(r'^# (.+)$', r'<h1>\1</h1>', content, flags=re.MULTILINE)
-        
-        # Convert bold
-        content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', content)
-        
-        # Convert italic
-        content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', content)
-        
-        # Convert code
-        content = re.sub(r'`(.+?)`', r'<code>\1</code>', content)
-        
-        # Convert blockquotes
-        content = re.sub(r'^> (.+)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
-        
-        # Convert lists
-        content = re.sub(r'^- (.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-        
-        # Convert links
-        content = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', content)
-        
-        # Convert paragraphs
-        content = re.sub(r'\n\n', '</p><p>', content)
-        
-        # Convert line breaks
-        content = re.sub(r'\n', '<br>', content)
-        
-        # Wrap in HTML
-        html = f"""<!DOCTYPE html>
-<html lang="vi">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <link rel="stylesheet" href="../style.css">
-    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;500;700&display=swap" rel="stylesheet">
-</head>
-<body>
-    <header>
-        <h1><a href="../index.html" style="color:white;text-decoration:none;">🇰🇷 TOPIK Daily</a></h1>
-    </header>
+    def _sidecar_matches(self, sidecar_name: str, digest: str, target_path: str) -> bool:
+        """True if target exists and was last written from content with this digest"""
+        try:
+            with open(os.path.join(self.output_dir, sidecar_name), "r", encoding="utf-8") as f:
+                return f.read() == digest and os.path.exists(target_path)
+        except FileNotFoundError:
+            return False
     
-    <article class="post">
-        <p>{content}</p>
-    </article>
-    
-    <footer>
-        <p><a href="../index.html">← Quay lại trang chủ</a></p>
-        <p>© 2026 TOPIK Daily</p>
-    </footer>
-</body>
-</html>
-"""
-        return html
+    def _write_sidecar(self, sidecar_name: str, digest: str):
+        with open(os.path.join(self.output_dir, sidecar_name), "w", encoding="utf-8") as f:
+            f.write(digest)
     
     def generate_index(self):
         """Generate index.html with all posts"""
-        posts_html = ""
-        for post in sorted(self.posts_data, key=lambda x: x["date"], reverse=True):
-            posts_html += POST_CARD_TEMPLATE.format(
-                slug=post["slug"],
-                title=post["title"],
-                date=post["date"],
-                topic=post["topic"],
-                excerpt=post["excerpt"]
-            )
-        
-        index_html = INDEX_TEMPLATE.format(posts_list=posts_html)
-        
+        posts = self.posts_data[::-1]  # Newest first
         index_path = os.path.join(self.output_dir, "index.html")
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(index_html)
+        
+        # Skip rendering when the card fields and templates are unchanged
+        index_hash = _digest(repr([
+            (post["slug"], post["date"], post["title"], post["topic"], post["excerpt"]) for post in posts
+        ]) + INDEX_TEMPLATE + POST_CARD_TEMPLATE)
+        
+        if not self._sidecar_matches(INDEX_HASH_FILE, index_hash, index_path):
+            parts = []
+            for post in posts:
+                parts.append(_CARD_TMPL.render(
+                    slug=post["slug"],
+                    title=post["title"],
+                    date=post["date"],
+                    topic=post["topic"],
+                    excerpt=post["excerpt"]
+                ))
+            posts_html = "".join(parts)
+            
+            index_html = _INDEX_TMPL.render(posts_list=posts_html)
+            _write_if_changed(index_path, index_html)
+            self._write_sidecar(INDEX_HASH_FILE, index_hash)
         
         # Generate CSS
         css_path = os.path.join(self.output_dir, "style.css")
-        with open(css_path, "w", encoding="utf-8") as f:
-            f.write(CSS_TEMPLATE)
+        if not self._sidecar_matches(CSS_HASH_FILE, _CSS_HASH, css_path):
+            _write_if_changed(css_path, CSS_TEMPLATE)
+            self._write_sidecar(CSS_HASH_FILE, _CSS_HASH)
         
-        logging.info(f"✅ Blog index generated: {index_path}")
+        logging.info("✅ Blog index generated: %s", index_path)
         
+    def add_post(self, post_info: Dict):
+        """Insert a post into posts_data, keeping date order without re-sorting"""
+        insort(self.posts_data, post_info, key=itemgetter("date"))
+    
+    def load_posts_index(self) -> Dict:
+        """Load the posts manifest ({"template_hash", "posts": {slug: post_info}})"""
+        index_path = os.path.join(self.output_dir, POSTS_INDEX_FILE)
+        try:
+            with open(index_path, "rb") as f:
+                return _json_loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def save_posts_index(self):
+        """Persist posts_data (already in date order) with the current template hash"""
+        index_path = os.path.join(self.output_dir, POSTS_INDEX_FILE)
+        _write_if_changed(index_path, _json_dumps_bytes({
+            "template_hash": _TEMPLATE_HASH,
+            "posts": {post["slug"]: post for post in self.posts_data},
+        }))
+    
     def generate_from_json(self, json_path: str) -> Dict:
         """Generate blog post from final_data.json file"""
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        src_mtime = os.stat(json_path).st_mtime
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
         
         self.setup_directories()
-        post_info = self.generate_post(data)
+        
+        # Skip render + write when the post HTML is newer than the input JSON
+        date = time.strftime("%Y-%m-%d")  # Computed once and passed to generate_post
+        topic = data.get("meta", {}).get("topic_title_vi", "TOPIK Daily")
+        slug = self.generate_slug(topic, date)
+        
+        posts_index = self.load_posts_index()
+        cached_posts = posts_index.get("posts", {})
+        for cached_slug, cached_info in cached_posts.items():
+            if cached_slug != slug:
+                self.add_post(cached_info)
+        
+        # Cached post_info is only reusable if it was rendered by the current templates
+        post_info = cached_posts.get(slug) if posts_index.get("template_hash") == _TEMPLATE_HASH else None
+        try:
+            is_fresh = post_info is not None and os.stat(post_info["html_path"]).st_mtime >= src_mtime
+        except OSError:
+            is_fresh = False
+        
+        if is_fresh:
+            self.add_post(post_info)
+            logging.info("⏭️ Blog post up to date: %s", slug)
+        else:
+            post_info = self.generate_post(data, date)
+            self.save_posts_index()
+        
         self.generate_index()
         
         return post_info
+    
+    def generate_many(self, jobs: List[Tuple[str, str]]) -> List[Dict]:
+        """Generate one post per (json_path, date) in parallel, then the index once"""
+        self.setup_directories()
+        
+        json_paths = [json_path for json_path, _ in jobs]
+        dates = [date for _, date in jobs]
+        output_dirs = [self.output_dir] * len(jobs)
+        
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_render_one, json_paths, dates, output_dirs))
+        else:
+            results = list(map(_render_one, json_paths, dates, output_dirs))
+        
+        new_slugs = {post_info["slug"] for post_info in results}
+        for cached_slug, cached_info in self.load_posts_index().get("posts", {}).items():
+            if cached_slug not in new_slugs:
+                self.add_post(cached_info)
+        for post_info in results:
+            self.add_post(post_info)
+        self.save_posts_index()
+        self.generate_index()
+        
+        return results
+
+
+def _render_one(json_path: str, date: str, output_dir: str) -> Dict:
+    """Worker for BlogGenerator.generate_many: render and write a single post"""
+    with open(json_path, "rb") as f:
+        data = _json_loads(f.read())
+    return BlogGenerator(output_dir).generate_post(data, date)
 
 
 def generate_blog_from_data(json_path: str, output_dir: str = BLOG_OUTPUT_DIR) -> Dict:
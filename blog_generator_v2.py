@@ -15,19 +15,24 @@ Features:
 
 from __future__ import annotations
 
+import io
 import re
 import json
+import hashlib
 import shutil
+import string
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 
 # Core framework
 from core import (
     Config, Logger, Database,
-    safe_json_load, safe_json_save,
+    safe_json_load, safe_json_save, json_loads,
     ensure_directory, sanitize_filename, truncate_text
 )
 
@@ -70,10 +75,9 @@ class PostInfo:
 
 # ==================== TEMPLATES ====================
 
-class Templates:
-    """HTML/CSS templates for blog generation"""
-    
-    BLOG_POST = """---
+# HTML/CSS templates for blog generation
+
+_TPL_BLOG_POST = """---
 title: "{title}"
 date: "{date}"
 topic: "{topic}"
@@ -155,7 +159,7 @@ Nghe bài học hôm nay trên [Spotify]({spotify_url})
 *Được tạo tự động bởi 데일리 코리안 System*
 """
 
-    INDEX = """<!DOCTYPE html>
+_TPL_INDEX = """<!DOCTYPE html>
 <html lang="vi">
 <head>
     <meta charset="UTF-8">
@@ -205,7 +209,7 @@ Nghe bài học hôm nay trên [Spotify]({spotify_url})
 </html>
 """
 
-    POST_CARD = """
+_TPL_POST_CARD = """
         <article class="post-card" data-date="{date}">
             <div class="post-meta">
                 <span class="date">📅 {date}</span>
@@ -221,7 +225,7 @@ Nghe bài học hôm nay trên [Spotify]({spotify_url})
         </article>
 """
 
-    CSS = """:root {
+_TPL_CSS = """:root {
     --primary: #1a73e8;
     --primary-dark: #1557b0;
     --secondary: #5f6368;
@@ -543,7 +547,7 @@ details summary {
 }
 """
 
-    RSS = """<?xml version="1.0" encoding="UTF-8"?>
+_TPL_RSS = """<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
 <channel>
     <title>데일리 코리안 - TOPIK Daily</title>
@@ -557,7 +561,7 @@ details summary {
 </rss>
 """
 
-    RSS_ITEM = """
+_TPL_RSS_ITEM = """
     <item>
         <title>{title}</title>
         <link>{base_url}/posts/{slug}.html</link>
@@ -567,7 +571,7 @@ details summary {
     </item>
 """
 
-    SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+_TPL_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
     <url>
         <loc>{base_url}</loc>
@@ -580,6 +584,216 @@ details summary {
 """
 
 
+def _compile_template(name: str, template: str) -> Callable[..., str]:
+    """
+    Specialize a str.format template into a Python function at import.
+    
+    The template is parsed once and emitted as one f-string expression, so
+    rendering is a single BUILD_STRING instead of re-walking the brace
+    grammar on every .format() call. Only plain {name} fields are supported.
+    """
+    pieces = []
+    fields = []
+    for literal, field_name, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            pieces.append("f" + repr(literal.replace("{", "{{").replace("}", "}}")))
+        if field_name is None:
+            continue
+        if not field_name.isidentifier() or spec or conversion:
+            raise ValueError(f"{name}: unsupported template field {{{field_name}}}")
+        pieces.append(f"f'{{{field_name}}}'")
+        if field_name not in fields:
+            fields.append(field_name)
+    
+    src = f"def {name}(*, {', '.join(fields)}):\n    return (\n        " + "\n        ".join(pieces) + "\n    )\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_render_blog_post = _compile_template("_render_blog_post", _TPL_BLOG_POST)
+
+# Frontmatter tag list: static head pre-serialized, only the topic is encoded per post
+_STATIC_TAG_PREFIX = json.dumps(["TOPIK", "Korean", "Learning", "Quiz"], ensure_ascii=False)[:-1] + ", "
+
+# Any template edit must defeat the unchanged-input build guard
+_TEMPLATES_HASH = hashlib.blake2b("".join((
+    _TPL_BLOG_POST, _TPL_INDEX, _TPL_POST_CARD,
+    _TPL_CSS, _TPL_RSS, _TPL_RSS_ITEM, _TPL_SITEMAP,
+)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Feed and sitemap are streamed: header, then one fragment per post, then footer
+_RSS_HEAD, _RSS_TAIL = _TPL_RSS.split("{items}")
+_SITEMAP_HEAD, _SITEMAP_TAIL = _TPL_SITEMAP.split("{urls}")
+_RSS_TAIL_BYTES = _RSS_TAIL.encode("utf-8")
+_SITEMAP_TAIL_BYTES = _SITEMAP_TAIL.encode("utf-8")
+
+# Static stylesheet, encoded once and written as-is on every rebuild
+_CSS_BYTES = _TPL_CSS.encode("utf-8")
+
+# RFC 822 names for RSS pubDate, independent of the process locale
+_DAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _rss_pub_date(date: str) -> str:
+    """YYYY-MM-DD -> 'Tue, 02 Jan 2024 00:00:00 GMT' by slicing, no strptime"""
+    y, m, d = int(date[:4]), int(date[5:7]), int(date[8:10])
+    weekday = datetime(y, m, d).weekday()
+    return f"{_DAY_ABBR[weekday]}, {d:02d} {_MONTH_ABBR[m - 1]} {y} 00:00:00 GMT"
+
+
+# HTML escaping as one C-level table lookup per code point
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;",
+})
+
+
+def _esc(text: Any) -> str:
+    """Escape text for HTML/XML element content and quoted attributes"""
+    return str(text).translate(_HTML_ESCAPE)
+
+
+# Rendered index cards are cached on disk; a template or escaping change invalidates them all
+_CARD_TEMPLATE_HASH = hashlib.blake2b(
+    (_TPL_POST_CARD + repr(sorted(_HTML_ESCAPE.items()))).encode("utf-8"), digest_size=8
+).hexdigest()
+
+
+def _card_key(post: PostInfo) -> str:
+    """Stable digest of every PostInfo field the index card renders"""
+    raw = "|".join((
+        post.slug, post.date, post.title, post.topic,
+        str(post.reading_time), ",".join(post.tags[:4]), post.excerpt,
+    ))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# ==================== MARKDOWN ====================
+
+_FRONTMATTER_RE = re.compile(r'^---[\s\S]*?---\n')
+
+# Inline spans, one alternation so each line is scanned once
+_INLINE_MD_RE = re.compile(
+    r'\*\*(?P<bold>.+?)\*\*'
+    r'|\*(?P<em>.+?)\*'
+    r'|`(?P<code>.+?)`'
+    r'|\[(?P<text>.+?)\]\((?P<href>.+?)\)'
+)
+
+
+def _inline_md_sub(m: re.Match) -> str:
+    """Render one inline match (dispatch on the group that matched)"""
+    kind = m.lastgroup
+    if kind == "bold":
+        return f"<strong>{_inline_md(m.group('bold'))}</strong>"
+    if kind == "em":
+        return f"<em>{_inline_md(m.group('em'))}</em>"
+    if kind == "code":
+        return f"<code>{m.group('code')}</code>"
+    return f'<a href="{m.group("href")}">{_inline_md(m.group("text"))}</a>'
+
+
+def _inline_md(text: str) -> str:
+    return _INLINE_MD_RE.sub(_inline_md_sub, text)
+
+
+def _md_text(text: str) -> str:
+    """Escape a markdown text span, then render its inline markup"""
+    return _INLINE_MD_RE.sub(_inline_md_sub, text.translate(_HTML_ESCAPE))
+
+
+# The only raw-HTML lines _render_markdown lets through: the literal tag lines
+# emitted by _format_vocabulary / _format_quiz. Data lines starting with "<" are escaped.
+_TRUSTED_HTML_LINES = frozenset((
+    '<div class="vocab-item">',
+    '<div class="quiz-section">',
+    '</div>',
+    '<details>',
+    '</details>',
+    '<summary>👁️ Xem đáp án</summary>',
+))
+
+# Vocab heading from _format_vocabulary; its word is _esc()'d, so a genuine heading
+# never contains '<', '>' or '"' between the tags
+_VOCAB_HEADING_RE = re.compile(r'<strong class="korean-text">[^<>"]*</strong>')
+
+
+def _render_markdown(content: str) -> str:
+    """
+    Single line-oriented pass over the markdown body.
+    
+    Headers, blockquotes, list items and rules are classified by prefix;
+    consecutive "- " lines become one <ul>, blank-line separated text
+    becomes one <p>, and the template's own tag lines (_TRUSTED_HTML_LINES,
+    vocab headings) pass through as raw HTML.
+    Text of every other line is HTML-escaped before inline markup.
+    """
+    parts: List[str] = []
+    para: List[str] = []
+    items: List[str] = []
+    
+    def flush():
+        if para:
+            parts.append(f"<p>{'<br>'.join(para)}</p>")
+            para.clear()
+        if items:
+            parts.append(f"<ul>{''.join(items)}</ul>")
+            items.clear()
+    
+    for line in content.splitlines():
+        line = line.rstrip()
+        if line.startswith("- "):
+            if para:
+                parts.append(f"<p>{'<br>'.join(para)}</p>")
+                para.clear()
+            items.append(f"<li>{_md_text(line[2:])}</li>")
+            continue
+        if not line or line[0] in "#>-":
+            flush()
+        if not line:
+            continue
+        if line.startswith("### "):
+            parts.append(f"<h3>{_md_text(line[4:])}</h3>")
+        elif line.startswith("## "):
+            parts.append(f"<h2>{_md_text(line[3:])}</h2>")
+        elif line.startswith("# "):
+            parts.append(f"<h1>{_md_text(line[2:])}</h1>")
+        elif line.startswith("> "):
+            parts.append(f"<blockquote>{_md_text(line[2:])}</blockquote>")
+        elif line == "---":
+            parts.append("<hr>")
+        elif line[0] == "<" and (line in _TRUSTED_HTML_LINES or _VOCAB_HEADING_RE.fullmatch(line)):
+            flush()
+            parts.append(line)
+        else:
+            para.append(_md_text(line))
+    flush()
+    
+    return "\n".join(parts)
+
+
+# Slug: keep word chars, whitespace and hyphen. Unicode \w already covers
+# Hangul and Vietnamese letters, so no explicit ranges are needed.
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+
+
+def _write_file(item: Tuple[Path, bytes]):
+    path, content = item
+    path.write_bytes(content)
+
+
+def _write_files(files: List[Tuple[Path, bytes]]):
+    """Write independent output files concurrently; blocking writes release the GIL"""
+    if len(files) == 1:
+        _write_file(files[0])
+        return
+    with ThreadPoolExecutor(max_workers=min(4, len(files))) as ex:
+        list(ex.map(_write_file, files))  # re-raise any write error
+
+
 # ==================== BLOG GENERATOR ====================
 
 class BlogGenerator:
@@ -611,10 +825,45 @@ class BlogGenerator:
         self.base_url = base_url.rstrip("/")
         
         self.posts: List[PostInfo] = []
-        self.templates = Templates()
+        self._pending_db_rows: List[Tuple[str, str, str, str]] = []
+        self._card_cache_path = self.output_dir / ".card_cache.json"
+        self._build_hash_path = self.output_dir / ".build_hash"
+        self._last_post_path = self.output_dir / ".last_post.json"
+        self._set_run_time()
         
         logger.info(f"BlogGenerator initialized: {self.output_dir}")
     
+    def _set_run_time(self):
+        """Take one timestamp per build so every output agrees on date and year"""
+        self._run_time = datetime.now()
+        self._run_year = self._run_time.year
+        self._run_date = self._run_time.strftime("%Y-%m-%d")
+        self._run_rfc822 = self._run_time.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        self._specialize_templates()
+    
+    def _specialize_templates(self):
+        """
+        Pre-bake base_url and the run timestamp into the site templates.
+        
+        Both are constant for a build, so the feed and sitemap headers become
+        ready-made bytes and the index/item templates keep only per-post fields.
+        """
+        base_url = self.base_url.replace("{", "{{").replace("}", "}}")
+        
+        def bake(template: str, **values: Any) -> str:
+            for key, value in values.items():
+                template = template.replace("{" + key + "}", value)
+            return template
+        
+        self._index_tpl = bake(_TPL_INDEX, base_url=base_url, year=str(self._run_year))
+        self._rss_item_tpl = bake(_TPL_RSS_ITEM, base_url=base_url)
+        self._rss_head = _RSS_HEAD.format(
+            base_url=self.base_url, build_date=self._run_rfc822
+        ).encode("utf-8")
+        self._sitemap_head = _SITEMAP_HEAD.format(
+            base_url=self.base_url, date=self._run_date
+        ).encode("utf-8")
+    
     def setup_directories(self):
         """Create necessary directories"""
         ensure_directory(self.output_dir)
@@ -634,20 +883,19 @@ class BlogGenerator:
             URL-safe slug
         """
         # Remove special characters, keep Korean/Vietnamese
-        slug = re.sub(
-            r'[^\w\s가-힣àáảãạăắằẳẵặâấầẩẫậèéẻẽẹêếềểễệìíỉĩịòóỏõọôốồổỗộơớờởỡợùúủũụưứừửữựỳýỷỹỵđ-]',
-            '',
-            title.lower()
-        )
-        slug = re.sub(r'\s+', '-', slug.strip())
+        slug = _SLUG_STRIP_RE.sub('', title.lower())
+        slug = "-".join(slug.split())  # collapse whitespace runs, trim ends
         slug = slug[:50]  # Limit length
         
         return f"{date}-{slug}"
     
-    def _calculate_reading_time(self, text: str) -> int:
-        """Calculate estimated reading time in minutes"""
-        words = len(text.split())
-        return max(1, words // 200)
+    def _sort_posts(self):
+        """Order posts newest first; index, RSS and sitemap iterate this order"""
+        self.posts.sort(key=attrgetter("date"), reverse=True)
+    
+    def _calculate_reading_time(self, word_count: int) -> int:
+        """Calculate estimated reading time in minutes (200 words/minute)"""
+        return max(1, word_count // 200)
     
     def _format_vocabulary(self, analysis_list: List[Dict]) -> str:
         """Format vocabulary section as HTML"""
@@ -656,7 +904,7 @@ class BlogGenerator:
         
         sections = []
         for i, item in enumerate(analysis_list[:15], 1):
-            word = item.get("item", "")
+            word = _esc(item.get("item", ""))  # sits inside a raw-HTML line
             explanation = item.get("professor_explanation", "")
             
             sections.append(f"""
@@ -729,28 +977,12 @@ class BlogGenerator:
     
     def _markdown_to_html(self, markdown_content: str, title: str, post: PostInfo) -> str:
         """Convert markdown to HTML with full page structure"""
-        # Remove frontmatter
-        content = re.sub(r'^---[\s\S]*?---\n', '', markdown_content)
-        
-        # Convert headers
-        content = re.sub(r'^### (.+)$', r'<h3>\1</h3>', content, flags=re.MULTILINE)
-        content = re.sub(r'^## (.+)$', r'<h2>\1</h2>', content, flags=re.MULTILINE)
-        content = re.sub(r'^# (.+)$', r'<h1>\1</h1>', content, flags=re.MULTILINE)
-        
-        # Convert formatting
-        content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', content)
-        content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', content)
-        content = re.sub(r'`(.+?)`', r'<code>\1</code>', content)
-        content = re.sub(r'^> (.+)$', r'<blockquote>\1</blockquote>', content, flags=re.MULTILINE)
-        content = re.sub(r'^- (.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-        content = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', content)
-        
-        # Convert paragraphs and line breaks
-        content = re.sub(r'\n\n', '</p><p>', content)
-        content = re.sub(r'\n', '<br>', content)
+        content = _render_markdown(_FRONTMATTER_RE.sub('', markdown_content, count=1))
         
         # Build tags HTML
-        tags_html = " ".join([f'<span class="tag">{tag}</span>' for tag in post.tags])
+        tags_html = " ".join([f'<span class="tag">{_esc(tag)}</span>' for tag in post.tags])
+        title = _esc(title)
+        meta_excerpt = _esc(truncate_text(post.excerpt, 160))
         
         return f"""<!DOCTYPE html>
 <html lang="vi">
@@ -758,10 +990,10 @@ class BlogGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} | 데일리 코리안</title>
-    <meta name="description" content="{truncate_text(post.excerpt, 160)}">
-    <meta name="keywords" content="{', '.join(post.tags)}">
+    <meta name="description" content="{meta_excerpt}">
+    <meta name="keywords" content="{_esc(', '.join(post.tags))}">
     <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{truncate_text(post.excerpt, 160)}">
+    <meta property="og:description" content="{meta_excerpt}">
     <meta property="og:type" content="article">
     <meta property="og:locale" content="vi_VN">
     <link rel="canonical" href="{self.base_url}/posts/{post.slug}.html">
@@ -779,7 +1011,7 @@ class BlogGenerator:
             <span class="reading-time">⏱️ {post.reading_time} phút đọc</span>
         </div>
         
-        <p>{content}</p>
+        {content}
         
         <div class="tags" style="margin-top: 2rem;">
             {tags_html}
@@ -788,7 +1020,7 @@ class BlogGenerator:
     
     <footer>
         <p><a href="../index.html">← Quay lại trang chủ</a></p>
-        <p>© {datetime.now().year} 데일리 코리안</p>
+        <p>© {self._run_year} 데일리 코리안</p>
     </footer>
 </body>
 </html>
@@ -806,7 +1038,7 @@ class BlogGenerator:
             PostInfo object with generated post details
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = self._run_date
         
         # Extract data sections
         meta = data.get("meta", {})
@@ -824,12 +1056,12 @@ class BlogGenerator:
         analysis_list = phase2.get("analysis_list", [])
         
         # Get Deep Dive data
-        deep_dive = phase4.get("video_5_deep_dive", phase3.get("video_5_deep_dive", {}))
+        deep_dive = phase4.get("video_5_deep_dive") or phase3.get("video_5_deep_dive") or {}
         paragraphs = deep_dive.get("essay", {}).get("paragraphs", [])
         
         # Get quizzes
-        vocab_quiz = phase3.get("video_3_vocab_quiz", phase4.get("video_3_vocab_quiz", {}))
-        grammar_quiz = phase3.get("video_4_grammar_quiz", phase4.get("video_4_grammar_quiz", {}))
+        vocab_quiz = phase3.get("video_3_vocab_quiz") or phase4.get("video_3_vocab_quiz") or {}
+        grammar_quiz = phase3.get("video_4_grammar_quiz") or phase4.get("video_4_grammar_quiz") or {}
         
         # Generate content
         title = f"TOPIK Daily - {topic}"
@@ -838,7 +1070,9 @@ class BlogGenerator:
         # Calculate metrics
         full_content = f"{news_kr} {news_vi} {essay}"
         word_count = len(full_content.split())
-        reading_time = self._calculate_reading_time(full_content)
+        reading_time = self._calculate_reading_time(word_count)
+        
+        excerpt = truncate_text(news_vi, 150)
         
         # Format sections
         vocabulary_section = self._format_vocabulary(analysis_list)
@@ -847,12 +1081,12 @@ class BlogGenerator:
         grammar_quiz_html = self._format_quiz(grammar_quiz)
         
         # Generate markdown
-        content = self.templates.BLOG_POST.format(
+        content = _render_blog_post(
             title=title,
             date=date,
             topic=topic,
-            tags=json.dumps(["TOPIK", "Korean", "Learning", "Quiz", topic], ensure_ascii=False),
-            description=truncate_text(news_vi, 150),
+            tags=_STATIC_TAG_PREFIX + json.dumps(topic, ensure_ascii=False) + "]",
+            description=excerpt,
             canonical_url=f"{self.base_url}/posts/{slug}.html",
             reading_time=reading_time,
             news_kr=news_kr,
@@ -877,7 +1111,7 @@ class BlogGenerator:
             slug=slug,
             date=date,
             topic=topic,
-            excerpt=truncate_text(news_vi, 150),
+            excerpt=excerpt,
             tags=["TOPIK", "Korean", "Learning", topic],
             word_count=word_count,
             reading_time=reading_time
@@ -899,101 +1133,107 @@ class BlogGenerator:
         self.posts.append(post)
         logger.info(f"Blog post generated: {slug}")
         
-        # Log to database
-        db.insert_content(
-            content_type="blog_post",
-            title=title,
-            file_path=str(html_path),
-            platform="blog"
-        )
+        # Queued for the database; written in one transaction by flush_db()
+        self._pending_db_rows.append(("blog_post", title, str(html_path), "blog"))
         
         return post
     
-    def generate_index(self):
-        """Generate index.html with all posts"""
-        posts_html = ""
-        for post in sorted(self.posts, key=lambda x: x.date, reverse=True):
-            tags_html = " ".join([
-                f'<span class="tag">{tag}</span>' 
-                for tag in post.tags[:4]
-            ])
-            
-            posts_html += self.templates.POST_CARD.format(
-                slug=post.slug,
-                title=post.title,
-                date=post.date,
-                topic=post.topic,
-                excerpt=post.excerpt,
-                reading_time=post.reading_time,
-                tags_html=tags_html
-            )
+    def flush_db(self):
+        """Write all queued content records to the database in one batch"""
+        if self._pending_db_rows:
+            db.insert_content_many(self._pending_db_rows)
+            self._pending_db_rows.clear()
+    
+    def _render_index(self) -> List[Tuple[Path, bytes]]:
+        """Render index.html and style.css as (path, bytes) pairs"""
+        cache = safe_json_load(self._card_cache_path, {})
+        cached_cards = cache.get("cards", {}) if cache.get("template") == _CARD_TEMPLATE_HASH else {}
+        cards = {}
         
-        index_html = self.templates.INDEX.format(
-            base_url=self.base_url,
+        card_parts = []
+        for post in self.posts:
+            key = _card_key(post)
+            card = cached_cards.get(key)
+            if card is None:
+                tags_html = " ".join([
+                    f'<span class="tag">{_esc(tag)}</span>' 
+                    for tag in post.tags[:4]
+                ])
+                
+                card = _TPL_POST_CARD.format(
+                    slug=post.slug,
+                    title=_esc(post.title),
+                    date=post.date,
+                    topic=_esc(post.topic),
+                    excerpt=_esc(post.excerpt),
+                    reading_time=post.reading_time,
+                    tags_html=tags_html
+                )
+            cards[key] = card
+            card_parts.append(card)
+        posts_html = "".join(card_parts)
+        
+        if cards != cached_cards:
+            safe_json_save({"template": _CARD_TEMPLATE_HASH, "cards": cards}, self._card_cache_path)
+        
+        index_html = self._index_tpl.format(
             posts_list=posts_html,
             pagination="",  # TODO: Implement pagination
-            year=datetime.now().year
         )
         
-        # Save index.html
-        index_path = self.output_dir / "index.html"
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(index_html)
-        
-        # Save CSS
-        css_path = self.output_dir / "style.css"
-        with open(css_path, "w", encoding="utf-8") as f:
-            f.write(self.templates.CSS)
-        
-        logger.info(f"Blog index generated: {index_path}")
+        return [
+            (self.output_dir / "index.html", index_html.encode("utf-8")),
+            (self.output_dir / "style.css", _CSS_BYTES),
+        ]
     
-    def generate_rss(self):
-        """Generate RSS feed"""
-        items = ""
-        for post in sorted(self.posts, key=lambda x: x.date, reverse=True)[:20]:
-            items += self.templates.RSS_ITEM.format(
-                title=post.title,
-                base_url=self.base_url,
+    def _render_rss(self) -> Tuple[Path, bytes]:
+        """Render feed.xml as a (path, bytes) pair"""
+        buf = io.BytesIO()
+        buf.write(self._rss_head)
+        for post in self.posts[:20]:
+            buf.write(self._rss_item_tpl.format(
+                title=_esc(post.title),
                 slug=post.slug,
                 excerpt=post.excerpt,
-                pub_date=datetime.strptime(post.date, "%Y-%m-%d").strftime("%a, %d %b %Y 00:00:00 GMT")
-            )
-        
-        rss_content = self.templates.RSS.format(
-            base_url=self.base_url,
-            build_date=datetime.now().strftime("%a, %d %b %Y %H:%M:%S GMT"),
-            items=items
-        )
-        
-        rss_path = self.output_dir / "feed.xml"
-        with open(rss_path, "w", encoding="utf-8") as f:
-            f.write(rss_content)
+                pub_date=_rss_pub_date(post.date)
+            ).encode("utf-8"))
+        buf.write(_RSS_TAIL_BYTES)
         
-        logger.info(f"RSS feed generated: {rss_path}")
+        return self.output_dir / "feed.xml", buf.getvalue()
     
-    def generate_sitemap(self):
-        """Generate sitemap.xml"""
-        urls = ""
+    def _render_sitemap(self) -> Tuple[Path, bytes]:
+        """Render sitemap.xml as a (path, bytes) pair"""
+        buf = io.BytesIO()
+        buf.write(self._sitemap_head)
         for post in self.posts:
-            urls += f"""
+            buf.write(f"""
     <url>
         <loc>{self.base_url}/posts/{post.slug}.html</loc>
         <lastmod>{post.date}</lastmod>
         <changefreq>monthly</changefreq>
         <priority>0.8</priority>
-    </url>"""
+    </url>""".encode("utf-8"))
+        buf.write(_SITEMAP_TAIL_BYTES)
         
-        sitemap_content = self.templates.SITEMAP.format(
-            base_url=self.base_url,
-            date=datetime.now().strftime("%Y-%m-%d"),
-            urls=urls
-        )
-        
-        sitemap_path = self.output_dir / "sitemap.xml"
-        with open(sitemap_path, "w", encoding="utf-8") as f:
-            f.write(sitemap_content)
-        
-        logger.info(f"Sitemap generated: {sitemap_path}")
+        return self.output_dir / "sitemap.xml", buf.getvalue()
+    
+    def generate_index(self):
+        """Generate index.html with all posts"""
+        files = self._render_index()
+        _write_files(files)
+        logger.info(f"Blog index generated: {files[0][0]}")
+    
+    def generate_rss(self):
+        """Generate RSS feed"""
+        rss_file = self._render_rss()
+        _write_files([rss_file])
+        logger.info(f"RSS feed generated: {rss_file[0]}")
+    
+    def generate_sitemap(self):
+        """Generate sitemap.xml"""
+        sitemap_file = self._render_sitemap()
+        _write_files([sitemap_file])
+        logger.info(f"Sitemap generated: {sitemap_file[0]}")
     
     def generate_from_json(self, json_path: str) -> PostInfo:
         """
@@ -1005,19 +1245,58 @@ class BlogGenerator:
         Returns:
             PostInfo for the generated post
         """
-        data = safe_json_load(json_path, {})
+        self._set_run_time()
+        raw = Path(json_path).read_bytes()
+        digest = hashlib.blake2b(raw, digest_size=16)
+        digest.update(f"|{self.base_url}|{_TEMPLATES_HASH}".encode("utf-8"))
+        build_hash = digest.hexdigest()
+        
+        # Unchanged input, templates and base URL: the site on disk is current
+        last_post = self._load_last_build(build_hash)
+        if last_post is not None:
+            logger.info(f"No changes since last build: {self.output_dir}")
+            return last_post
+        
+        try:
+            data = json_loads(raw)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {json_path}: {e}")
+            data = {}
         if not data:
             raise FileNotFoundError(f"Failed to load: {json_path}")
         
         self.setup_directories()
         post = self.generate_post(data)
-        self.generate_index()
-        self.generate_rss()
-        self.generate_sitemap()
+        self._sort_posts()
+        
+        # Site files are independent of each other: render, then write together
+        _write_files([*self._render_index(), self._render_rss(), self._render_sitemap()])
+        
+        self.flush_db()
+        
+        safe_json_save(post.to_dict(), self._last_post_path)
+        self._build_hash_path.write_text(build_hash, encoding="utf-8")
         
         logger.info(f"Blog generation complete: {self.output_dir}")
         
         return post
+    
+    def _load_last_build(self, build_hash: str) -> Optional[PostInfo]:
+        """Return the previous build's PostInfo if it was built from build_hash"""
+        try:
+            if self._build_hash_path.read_text(encoding="utf-8") != build_hash:
+                return None
+        except OSError:
+            return None
+        
+        last = safe_json_load(self._last_post_path, {})
+        try:
+            post = PostInfo(**last)
+        except TypeError:
+            return None
+        if not Path(post.html_path).exists():
+            return None
+        return post
 
 
 # ==================== PUBLIC API ====================
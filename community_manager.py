@@ -15,11 +15,17 @@ Revenue Potential: $100-500/month (premium community memberships)
 """
 
 import os
-import json
+import queue
+import string
+import atexit
 import logging
 import sqlite3
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from pathlib import Path
 
 # ==================== CONFIGURATION ====================
@@ -27,6 +33,21 @@ COMMUNITY_DIR = Path("community_data")
 COMMUNITY_DIR.mkdir(exist_ok=True)
 
 DB_PATH = COMMUNITY_DIR / "community.db"
+DB_READERS = int(os.getenv("COMMUNITY_DB_READERS", "4"))
+DB_STATEMENT_CACHE = 128
+ACTIVITY_FLUSH_INTERVAL = 0.5  # seconds between batched activity_log writes
+
+# Applied to every pooled connection: WAL lets readers run alongside the
+# writer, synchronous=NORMAL fsyncs per checkpoint instead of per commit
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+)
 
 
 # ==================== TEMPLATES ====================
@@ -106,6 +127,24 @@ Nghe audio và trả lời câu hỏi:
 """
 ]
 
+def _compile_tip_template(template: str) -> Callable[[Dict], str]:
+    """
+    Specialize a {field} template into `lambda d: f"..."` once at import,
+    so rendering is a single f-string build instead of a str.format parse.
+    """
+    pieces = []
+    for literal, field_name, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            pieces.append("f" + repr(literal.replace("{", "{{").replace("}", "}}")))
+        if field_name is not None:
+            if not field_name.isidentifier() or spec or conversion:
+                raise ValueError(f"Unsupported tip template field: {{{field_name}}}")
+            pieces.append('f"{d[' + repr(field_name) + ']}"')
+    return eval(compile("lambda d: (" + " ".join(pieces) + ")", "<daily_tip>", "eval"))
+
+
+_DAILY_TIP_RENDERERS = [_compile_tip_template(t) for t in DAILY_TIP_TEMPLATES]
+
 FAQ_RESPONSES = {
     "topik_date": """
 📅 **Lịch thi TOPIK 2024-2025:**
@@ -144,197 +183,347 @@ FAQ_RESPONSES = {
 }
 
 
+# FAQ triggers in priority order: the first FAQ with any keyword present wins
+FAQ_KEYWORDS = {
+    "topik_date": ("thi topik", "lịch thi", "ngày thi", "topik date"),
+    "how_to_study": ("học thế nào", "cách học", "how to study", "bắt đầu"),
+    "free_resources": ("tài liệu", "free", "miễn phí", "resources"),
+}
+
+# Flattened once: one tuple walk with C-level substring checks per message
+_FAQ_TRIGGERS = tuple(
+    (keyword, faq_key)
+    for faq_key, keywords in FAQ_KEYWORDS.items()
+    for keyword in keywords
+)
+
+
+# First characters of all keywords: a message sharing none of them cannot match
+_FAQ_FIRST_CHARS = frozenset(keyword[0] for keyword, _ in _FAQ_TRIGGERS)
+
+
+def match_faq(message_lower: str) -> Optional[str]:
+    """Return the FAQ key triggered by a lower-cased message, if any"""
+    # Pre-filter (no false negatives): one C-level set scan rejects
+    # short chat like "ok" / "👍" before any substring search
+    if _FAQ_FIRST_CHARS.isdisjoint(message_lower):
+        return None
+    for keyword, faq_key in _FAQ_TRIGGERS:
+        if keyword in message_lower:
+            return faq_key
+    return None
+
+
+# ==================== ENCODED REPLIES ====================
+# Send paths (Telegram/Discord HTTP bodies) need UTF-8 bytes: encode the
+# static replies once here instead of on every send.
+
+_FAQ_BYTES: Dict[str, bytes] = {
+    faq_key: response.encode("utf-8") for faq_key, response in FAQ_RESPONSES.items()
+}
+
+# Welcome templates pre-split around their single {name} placeholder
+_WELCOME_BYTES: Dict[str, Tuple[bytes, bytes]] = {
+    language: tuple(part.encode("utf-8") for part in template.split("{name}", 1))
+    for language, template in WELCOME_MESSAGES.items()
+}
+
+
+# ==================== SQL ====================
+# Statement text is kept in constants so every call hits the same entry in
+# each connection's prepared-statement cache (DB_STATEMENT_CACHE).
+
+_SQL_ADD_MEMBER = """
+    INSERT INTO members (platform, platform_id, username, display_name, language)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(platform, platform_id) DO UPDATE SET
+        username = excluded.username,
+        display_name = excluded.display_name,
+        last_active = CURRENT_TIMESTAMP
+    RETURNING id
+"""
+_SQL_LOG_ACTIVITY = """
+    INSERT INTO activity_log (member_id, activity_type, details)
+    VALUES (?, ?, ?)
+"""
+# Continue the streak if active since yesterday (UTC, like CURRENT_TIMESTAMP), else reset
+_SQL_UPDATE_STREAK = """
+    UPDATE members SET
+        streak_days = CASE
+            WHEN date(last_active) >= date('now', '-1 day') THEN streak_days + 1
+            ELSE 1
+        END,
+        last_active = CURRENT_TIMESTAMP
+    WHERE id = ?
+    RETURNING streak_days
+"""
+_SQL_ADD_POINTS = "UPDATE members SET total_points = total_points + ? WHERE id = ?"
+_SQL_LEADERBOARD = """
+    SELECT display_name, username, total_points, streak_days
+    FROM members
+    ORDER BY total_points DESC
+    LIMIT ?
+"""
+# All member stats in one scan; dates in UTC, matching CURRENT_TIMESTAMP
+_SQL_STATS = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(is_premium = 1), 0),
+        COALESCE(SUM(date(last_active) = date('now')), 0),
+        COALESCE(SUM(joined_at >= datetime('now', '-7 days')), 0)
+    FROM members
+"""
+_SQL_ADD_SUBSCRIPTION = """
+    INSERT INTO subscriptions (member_id, plan, amount, expires_at)
+    VALUES (?, ?, ?, datetime('now', ? || ' days'))
+"""
+_SQL_SET_PREMIUM = "UPDATE members SET is_premium = 1 WHERE id = ?"
+# Expiry checked in SQL (UTC); datetime() also normalizes older ISO 'T' timestamps
+_SQL_ACTIVE_SUBSCRIPTION = """
+    SELECT
+        plan,
+        expires_at,
+        datetime(expires_at) < datetime('now'),
+        CAST(julianday(expires_at) - julianday('now') AS INTEGER)
+    FROM subscriptions
+    WHERE member_id = ? AND is_active = 1
+    ORDER BY expires_at DESC
+    LIMIT 1
+"""
+
+
+class _ConnectionPool:
+    """
+    Reusable SQLite connections for one database file: one writer plus a
+    LIFO stack of up to `readers` read connections, opened on first use.
+    
+    Connections run in autocommit mode (isolation_level=None) with DB_PRAGMAS
+    applied; each write block is a BEGIN IMMEDIATE transaction serialized on
+    a lock.
+    """
+    
+    def __init__(self, db_path: str, readers: int = DB_READERS):
+        self.db_path = db_path
+        self.max_readers = max(1, readers)
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._open_lock = threading.Lock()
+        # CommunityDatabase instances on this pool; held weakly so short-lived
+        # instances are not kept alive until exit. close() flushes their buffers.
+        self.databases: "weakref.WeakSet[CommunityDatabase]" = weakref.WeakSet()
+        atexit.register(self.close)
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=DB_STATEMENT_CACHE,
+        )
+        for pragma in DB_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if len(self._all_readers) < self.max_readers:
+                conn = self._connect()
+                self._all_readers.append(conn)
+                return conn
+        return self._readers.get()
+    
+    @contextmanager
+    def get_conn(self, readonly: bool = False):
+        """Borrow a connection; write blocks commit on success, roll back on error"""
+        if readonly:
+            conn = self._acquire_reader()
+            try:
+                yield conn
+            finally:
+                self._readers.put(conn)
+            return
+        
+        with self._write_lock:
+            conn = self._writer
+            # Take the write lock up front rather than failing with SQLITE_BUSY mid-transaction
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+    
+    def close(self):
+        """Flush buffered activity, then close every pooled connection (registered with atexit)"""
+        for db in list(self.databases):
+            db.flush_activity()
+        with self._write_lock, self._open_lock:
+            for conn in [self._writer, *self._all_readers]:
+                conn.close()
+            self._all_readers.clear()
+
+
+_POOLS: Dict[str, _ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(db_path: str) -> _ConnectionPool:
+    """One shared pool per database file across all CommunityDatabase instances"""
+    key = os.path.abspath(db_path)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = _ConnectionPool(db_path)
+        return pool
+
+
 class CommunityDatabase:
     """SQLite database for community management"""
     
     def __init__(self, db_path: str = str(DB_PATH)):
         self.db_path = db_path
+        self.pool = _get_pool(db_path)
         self.init_db()
+        
+        # Activity rows are buffered and written in batches by a timer
+        self._activity_buffer: Deque[Tuple[int, str, Optional[str]]] = deque()
+        self._activity_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self.pool.databases.add(self)  # flushed once by the pool's atexit close
     
     def init_db(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Members table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS members (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL,
-                platform_id TEXT NOT NULL,
-                username TEXT,
-                display_name TEXT,
-                language TEXT DEFAULT 'vi',
-                is_premium BOOLEAN DEFAULT 0,
-                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                streak_days INTEGER DEFAULT 0,
-                total_points INTEGER DEFAULT 0,
-                UNIQUE(platform, platform_id)
-            )
-        """)
-        
-        # Activity log
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS activity_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_id INTEGER,
-                activity_type TEXT,
-                details TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (member_id) REFERENCES members(id)
-            )
-        """)
-        
-        # Premium subscriptions
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS subscriptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_id INTEGER,
-                plan TEXT,
-                amount REAL,
-                currency TEXT DEFAULT 'USD',
-                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                expires_at TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1,
-                FOREIGN KEY (member_id) REFERENCES members(id)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self.pool.get_conn() as conn:
+            cursor = conn.cursor()
+            
+            # Members table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS members (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT NOT NULL,
+                    platform_id TEXT NOT NULL,
+                    username TEXT,
+                    display_name TEXT,
+                    language TEXT DEFAULT 'vi',
+                    is_premium BOOLEAN DEFAULT 0,
+                    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    streak_days INTEGER DEFAULT 0,
+                    total_points INTEGER DEFAULT 0,
+                    UNIQUE(platform, platform_id)
+                )
+            """)
+            
+            # Activity log
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS activity_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    member_id INTEGER,
+                    activity_type TEXT,
+                    details TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (member_id) REFERENCES members(id)
+                )
+            """)
+            
+            # Premium subscriptions
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS subscriptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    member_id INTEGER,
+                    plan TEXT,
+                    amount REAL,
+                    currency TEXT DEFAULT 'USD',
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at TIMESTAMP,
+                    is_active BOOLEAN DEFAULT 1,
+                    FOREIGN KEY (member_id) REFERENCES members(id)
+                )
+            """)
+            
+            # Indexes for leaderboard ordering, stats filters and activity lookups
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_members_points ON members(total_points DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_members_last_active ON members(last_active)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_members_joined ON members(joined_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_members_premium ON members(is_premium) WHERE is_premium = 1")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_activity_member ON activity_log(member_id, created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_subscriptions_member ON subscriptions(member_id, is_active, expires_at)")
     
     def add_member(self, platform: str, platform_id: str, username: str = None, 
                    display_name: str = None, language: str = "vi") -> int:
         """Add or update member"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO members (platform, platform_id, username, display_name, language)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(platform, platform_id) DO UPDATE SET
-                username = excluded.username,
-                display_name = excluded.display_name,
-                last_active = CURRENT_TIMESTAMP
-        """, (platform, platform_id, username, display_name, language))
-        
-        member_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.pool.get_conn() as conn:
+            cursor = conn.cursor()
+            
+            # RETURNING gives the row id on both insert and conflict-update;
+            # lastrowid would be stale on the shared writer connection
+            cursor.execute(_SQL_ADD_MEMBER, (platform, platform_id, username, display_name, language))
+            
+            member_id = cursor.fetchone()[0]
         
         return member_id
     
     def log_activity(self, member_id: int, activity_type: str, details: str = None):
-        """Log member activity"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO activity_log (member_id, activity_type, details)
-            VALUES (?, ?, ?)
-        """, (member_id, activity_type, details))
-        
-        conn.commit()
-        conn.close()
-    
-    def update_streak(self, member_id: int):
-        """Update member streak"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Check if active yesterday
-        cursor.execute("""
-            SELECT last_active FROM members WHERE id = ?
-        """, (member_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            last_active = datetime.fromisoformat(row[0]) if row[0] else None
-            yesterday = datetime.now() - timedelta(days=1)
-            
-            if last_active and last_active.date() >= yesterday.date():
-                # Continue streak
-                cursor.execute("""
-                    UPDATE members SET streak_days = streak_days + 1, last_active = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (member_id,))
-            else:
-                # Reset streak
-                cursor.execute("""
-                    UPDATE members SET streak_days = 1, last_active = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (member_id,))
-        
-        conn.commit()
-        conn.close()
+        """Log member activity (buffered; written within ACTIVITY_FLUSH_INTERVAL)"""
+        with self._activity_lock:
+            self._activity_buffer.append((member_id, activity_type, details))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(ACTIVITY_FLUSH_INTERVAL, self.flush_activity)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush_activity(self):
+        """Write all buffered activity rows in one transaction"""
+        with self._activity_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            rows = list(self._activity_buffer)
+            self._activity_buffer.clear()
+        
+        if not rows:
+            return
+        try:
+            with self.pool.get_conn() as conn:
+                conn.cursor().executemany(_SQL_LOG_ACTIVITY, rows)
+        except sqlite3.Error as e:
+            logging.error(f"❌ Failed to write {len(rows)} activity rows: {e}")
+    
+    def update_streak(self, member_id: int) -> int:
+        """Update member streak, return the new streak_days (0 if no such member)"""
+        with self.pool.get_conn() as conn:
+            row = conn.cursor().execute(_SQL_UPDATE_STREAK, (member_id,)).fetchone()
+        return row[0] if row else 0
     
     def add_points(self, member_id: int, points: int):
         """Add points to member"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE members SET total_points = total_points + ?
-            WHERE id = ?
-        """, (points, member_id))
-        
-        conn.commit()
-        conn.close()
+        with self.pool.get_conn() as conn:
+            conn.cursor().execute(_SQL_ADD_POINTS, (points, member_id))
     
     def get_leaderboard(self, limit: int = 10) -> List[Dict]:
         """Get leaderboard"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT display_name, username, total_points, streak_days
-            FROM members
-            ORDER BY total_points DESC
-            LIMIT ?
-        """, (limit,))
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                "name": row[0] or row[1] or "Unknown",
-                "points": row[2],
-                "streak": row[3],
-            })
-        
-        conn.close()
-        return results
+        # Top-K is an index walk on idx_members_points; only `limit` rows reach Python
+        with self.pool.get_conn(readonly=True) as conn:
+            rows = conn.cursor().execute(_SQL_LEADERBOARD, (limit,)).fetchall()
+        
+        return [
+            {"name": display_name or username or "Unknown", "points": points, "streak": streak}
+            for display_name, username, points, streak in rows
+        ]
     
     def get_stats(self) -> Dict:
         """Get community stats"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total members
-        cursor.execute("SELECT COUNT(*) FROM members")
-        total_members = cursor.fetchone()[0]
-        
-        # Premium members
-        cursor.execute("SELECT COUNT(*) FROM members WHERE is_premium = 1")
-        premium_members = cursor.fetchone()[0]
-        
-        # Active today
-        today = datetime.now().date().isoformat()
-        cursor.execute("""
-            SELECT COUNT(*) FROM members 
-            WHERE date(last_active) = ?
-        """, (today,))
-        active_today = cursor.fetchone()[0]
-        
-        # New this week
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        cursor.execute("""
-            SELECT COUNT(*) FROM members 
-            WHERE joined_at >= ?
-        """, (week_ago,))
-        new_this_week = cursor.fetchone()[0]
-        
-        conn.close()
+        with self.pool.get_conn(readonly=True) as conn:
+            total_members, premium_members, active_today, new_this_week = (
+                conn.cursor().execute(_SQL_STATS).fetchone()
+            )
         
         return {
             "total_members": total_members,
@@ -344,15 +533,21 @@ class CommunityDatabase:
         }
 
 
+async def _to_thread(func: Callable, *args):
+    """asyncio.to_thread, importing asyncio (~40 ms) only once an async caller needs it"""
+    import asyncio
+    return await asyncio.to_thread(func, *args)
+
+
 class CommunityBot:
     """Bot for Discord/Telegram community management"""
     
     def __init__(self):
         self.db = CommunityDatabase()
     
-    def handle_new_member(self, platform: str, user_id: str, username: str = None, 
-                          display_name: str = None, language: str = "vi") -> str:
-        """Handle new member join"""
+    def _register_member(self, platform: str, user_id: str, username: str = None,
+                         display_name: str = None, language: str = "vi") -> Tuple[str, str]:
+        """Record the join, return (welcome language, display name)"""
         
         # Add to database
         member_id = self.db.add_member(platform, user_id, username, display_name, language)
@@ -360,26 +555,34 @@ class CommunityBot:
         # Log activity
         self.db.log_activity(member_id, "join", f"Joined from {platform}")
         
-        # Get welcome message
-        welcome = WELCOME_MESSAGES.get(language, WELCOME_MESSAGES["vi"])
-        name = display_name or username or "bạn"
-        
-        return welcome.format(name=name)
+        if language not in WELCOME_MESSAGES:
+            language = "vi"
+        return language, display_name or username or "bạn"
     
-    def handle_message(self, platform: str, user_id: str, message: str) -> Optional[str]:
-        """Handle user message, return response if applicable"""
+    def handle_new_member(self, platform: str, user_id: str, username: str = None, 
+                          display_name: str = None, language: str = "vi") -> str:
+        """Handle new member join"""
         
-        message_lower = message.lower()
+        language, name = self._register_member(platform, user_id, username, display_name, language)
         
-        # Check for FAQ triggers
-        if any(word in message_lower for word in ["thi topik", "lịch thi", "ngày thi", "topik date"]):
-            return FAQ_RESPONSES["topik_date"]
+        return WELCOME_MESSAGES[language].format(name=name)
+    
+    def handle_new_member_bytes(self, platform: str, user_id: str, username: str = None,
+                                display_name: str = None, language: str = "vi") -> bytes:
+        """handle_new_member, returning the UTF-8 welcome ready to send"""
+        
+        language, name = self._register_member(platform, user_id, username, display_name, language)
+        head, tail = _WELCOME_BYTES[language]
         
-        if any(word in message_lower for word in ["học thế nào", "cách học", "how to study", "bắt đầu"]):
-            return FAQ_RESPONSES["how_to_study"]
+        return head + name.encode("utf-8") + tail
+    
+    def _match_or_log(self, platform: str, user_id: str, message: str) -> Optional[str]:
+        """Return the triggered FAQ key, or log the message as activity"""
         
-        if any(word in message_lower for word in ["tài liệu", "free", "miễn phí", "resources"]):
-            return FAQ_RESPONSES["free_resources"]
+        # Check for FAQ triggers
+        faq_key = match_faq(message.lower())
+        if faq_key:
+            return faq_key
         
         # Update activity
         member_id = self.db.add_member(platform, user_id)
@@ -387,6 +590,18 @@ class CommunityBot:
         
         return None
     
+    def handle_message(self, platform: str, user_id: str, message: str) -> Optional[str]:
+        """Handle user message, return response if applicable"""
+        
+        faq_key = self._match_or_log(platform, user_id, message)
+        return FAQ_RESPONSES[faq_key] if faq_key else None
+    
+    def handle_message_bytes(self, platform: str, user_id: str, message: str) -> Optional[bytes]:
+        """handle_message, returning the pre-encoded UTF-8 reply"""
+        
+        faq_key = self._match_or_log(platform, user_id, message)
+        return _FAQ_BYTES[faq_key] if faq_key else None
+    
     def handle_reaction(self, platform: str, user_id: str, emoji: str):
         """Handle reaction to daily content"""
         
@@ -398,6 +613,26 @@ class CommunityBot:
             self.db.update_streak(member_id)
             self.db.log_activity(member_id, "reaction", emoji)
     
+    # ─── Async entry points ──────────────────────────────────────────────────
+    # For async bot frameworks (python-telegram-bot, discord.py): the blocking
+    # SQLite work runs in a worker thread so the event loop keeps serving other
+    # chats. The pool is thread-safe, and reads overlap on separate connections.
+    
+    async def handle_new_member_async(self, platform: str, user_id: str, username: str = None,
+                                      display_name: str = None, language: str = "vi") -> str:
+        return await _to_thread(
+            self.handle_new_member, platform, user_id, username, display_name, language
+        )
+    
+    async def handle_message_async(self, platform: str, user_id: str, message: str) -> Optional[str]:
+        return await _to_thread(self.handle_message, platform, user_id, message)
+    
+    async def handle_reaction_async(self, platform: str, user_id: str, emoji: str):
+        return await _to_thread(self.handle_reaction, platform, user_id, emoji)
+    
+    async def get_leaderboard_message_async(self) -> str:
+        return await _to_thread(self.get_leaderboard_message)
+    
     def get_daily_content(self, content_data: Dict) -> str:
         """Generate daily content post"""
         
@@ -408,25 +643,23 @@ class CommunityBot:
         vocab = content_data.get("vocabulary", [])
         if vocab:
             word = vocab[0]
-            template = DAILY_TIP_TEMPLATES[0]
-            return template.format(
-                korean=word.get("korean", ""),
-                romanization=word.get("romanization", ""),
-                meaning=word.get("meaning", ""),
-                example_ko=word.get("example_ko", ""),
-                example_vi=word.get("example_vi", ""),
-            )
+            return _DAILY_TIP_RENDERERS[0]({
+                "korean": word.get("korean", ""),
+                "romanization": word.get("romanization", ""),
+                "meaning": word.get("meaning", ""),
+                "example_ko": word.get("example_ko", ""),
+                "example_vi": word.get("example_vi", ""),
+            })
         
         # Get grammar
         grammar = content_data.get("grammar", [])
         if grammar:
             g = grammar[0]
-            template = DAILY_TIP_TEMPLATES[1]
-            return template.format(
-                pattern=g.get("pattern", ""),
-                meaning=g.get("meaning", ""),
-                example=g.get("example1_ko", ""),
-            )
+            return _DAILY_TIP_RENDERERS[1]({
+                "pattern": g.get("pattern", ""),
+                "meaning": g.get("meaning", ""),
+                "example": g.get("example1_ko", ""),
+            })
         
         return ""
     
@@ -468,57 +701,40 @@ class PremiumManager:
         
         plan_info = self.PLANS[plan]
         
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-        
-        expires_at = (datetime.now() + timedelta(days=plan_info["duration_days"])).isoformat()
-        
-        cursor.execute("""
-            INSERT INTO subscriptions (member_id, plan, amount, expires_at)
-            VALUES (?, ?, ?, ?)
-        """, (member_id, plan, plan_info["price"], expires_at))
-        
-        # Update member status
-        cursor.execute("""
-            UPDATE members SET is_premium = 1 WHERE id = ?
-        """, (member_id,))
-        
-        conn.commit()
-        conn.close()
+        with self.db.pool.get_conn() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_ADD_SUBSCRIPTION, (member_id, plan, plan_info["price"], plan_info["duration_days"]))
+            
+            # Update member status
+            cursor.execute(_SQL_SET_PREMIUM, (member_id,))
         
         return True
     
     def check_subscription(self, member_id: int) -> Dict:
         """Check subscription status"""
         
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT plan, expires_at, is_active
-            FROM subscriptions
-            WHERE member_id = ? AND is_active = 1
-            ORDER BY expires_at DESC
-            LIMIT 1
-        """, (member_id,))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self.db.pool.get_conn(readonly=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(_SQL_ACTIVE_SUBSCRIPTION, (member_id,))
+            
+            row = cursor.fetchone()
         
         if not row:
             return {"is_premium": False}
         
-        expires_at = datetime.fromisoformat(row[1])
-        is_expired = expires_at < datetime.now()
+        plan, expires_at, is_expired, days_remaining = row
         
         return {
             "is_premium": not is_expired,
-            "plan": row[0],
-            "expires_at": row[1],
-            "days_remaining": (expires_at - datetime.now()).days if not is_expired else 0,
+            "plan": plan,
+            "expires_at": expires_at,
+            "days_remaining": days_remaining if not is_expired else 0,
         }
     
-    def get_premium_benefits(self) -> str:
+    @staticmethod
+    def get_premium_benefits() -> str:
         """Get premium benefits message"""
         
         return """
@@ -612,16 +828,16 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    # Only the selected branch builds objects / opens the database
     if args.stats:
-        stats = get_community_stats()
-        print(json.dumps(stats, indent=2))
+        import json
+        print(json.dumps(get_community_stats(), indent=2))
     elif args.leaderboard:
-        bot = CommunityBot()
-        print(bot.get_leaderboard_message())
+        print(CommunityBot().get_leaderboard_message())
     elif args.report:
         print(generate_weekly_report())
     elif args.benefits:
-        manager = PremiumManager()
-        print(manager.get_premium_benefits())
+        # Static text: no PremiumManager, so no database connection
+        print(PremiumManager.get_premium_benefits())
     else:
         parser.print_help()
@@ -12,6 +12,7 @@ from .database import Database, get_db
 from .utils import (
     safe_json_load,
     safe_json_save,
+    json_loads,
     retry_with_backoff,
     validate_file_exists,
     ensure_directory,
@@ -73,6 +74,7 @@ __all__ = [
     # Utils
     "safe_json_load",
     "safe_json_save",
+    "json_loads",
     "retry_with_backoff",
     "validate_file_exists",
     "ensure_directory",
@@ -8,8 +8,9 @@ Supports environment variables, .env files, and defaults.
 """
 
 import os
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Dict, Any
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
@@ -17,7 +18,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API-related configuration"""
     gemini_api_key: str = ""
@@ -26,7 +27,7 @@ class APIConfig:
     openai_api_key: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram bot configuration"""
     bot_token: str = ""
@@ -38,7 +39,7 @@ class TelegramConfig:
     kofi_url: str = "https://ko-fi.com/topikdaily"
 
 
-@dataclass
+@dataclass(slots=True)
 class YouTubeConfig:
     """YouTube configuration"""
     client_secrets_file: str = "client_secrets.json"
@@ -47,7 +48,7 @@ class YouTubeConfig:
     default_category: str = "27"  # Education
 
 
-@dataclass
+@dataclass(slots=True)
 class GoogleDriveConfig:
     """Google Drive configuration"""
     folder_id: str = ""
@@ -55,7 +56,7 @@ class GoogleDriveConfig:
     client_secrets_file: str = "client_secrets.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailConfig:
     """Email configuration"""
     smtp_server: str = "smtp.gmail.com"
@@ -66,7 +67,7 @@ class EmailConfig:
     mailchimp_api_key: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialConfig:
     """Social media configuration"""
     twitter_bearer_token: str = ""
@@ -74,7 +75,7 @@ class SocialConfig:
     tiktok_access_token: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PathsConfig:
     """File paths configuration"""
     root_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
@@ -88,16 +89,17 @@ class PathsConfig:
     premium_dir: Path = field(default_factory=lambda: Path("premium_content"))
     data_file: str = "topik-video/public/final_data.json"
     
-    def __post_init__(self):
-        """Ensure directories exist"""
-        for dir_attr in ['data_dir', 'logs_dir', 'output_dir', 'blog_dir', 
-                         'podcast_dir', 'anki_dir', 'premium_dir']:
+    def ensure(self) -> "PathsConfig":
+        """Ensure directories exist (called once from get_config, not per construction)"""
+        for dir_attr in ('data_dir', 'logs_dir', 'output_dir', 'blog_dir',
+                         'podcast_dir', 'anki_dir', 'premium_dir'):
             path = getattr(self, dir_attr)
             if isinstance(path, Path):
                 path.mkdir(parents=True, exist_ok=True)
+        return self
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentConfig:
     """Content generation settings"""
     max_tiktok_duration: int = 59  # seconds
@@ -109,7 +111,7 @@ class ContentConfig:
     video_fps: int = 30
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Master configuration class"""
     api: APIConfig = field(default_factory=APIConfig)
@@ -177,21 +179,17 @@ class Config:
         }
 
 
-# Singleton instance
-_config: Optional[Config] = None
-
-
+# Singleton: functools.cache keeps the one Config instance (frozen, so shared safely)
+@functools.cache
 def get_config() -> Config:
     """Get or create configuration singleton"""
-    global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    config = Config.from_env()
+    config.paths.ensure()
+    return config
 
 
 def reload_config() -> Config:
     """Force reload configuration from environment"""
-    global _config
+    get_config.cache_clear()
     load_dotenv(override=True)
-    _config = Config.from_env()
-    return _config
+    return get_config()
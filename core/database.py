@@ -6,21 +6,48 @@ SQLite database for analytics, user tracking, and content management.
 ================================================================================
 """
 
+import copy
+import time
+import queue
+import atexit
 import sqlite3
+import threading
+import functools
 import json
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from contextlib import contextmanager
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 # ==================== CONFIGURATION ====================
 DATA_DIR = Path("data")
 DATA_DIR.mkdir(exist_ok=True)
 DB_PATH = DATA_DIR / "dailykorean.db"
 
+# journal_mode is stored in the database file, so it is set once in __init__;
+# the rest are per-connection and applied on every open. WAL lets reads run
+# alongside a writer, synchronous=NORMAL fsyncs per checkpoint not per commit.
+# optimize=0x10002 refreshes stale planner statistics for a long-lived connection.
+DB_JOURNAL_MODE = "PRAGMA journal_mode=WAL"
+DB_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA foreign_keys=ON;
+    PRAGMA optimize=0x10002;
+"""
+DB_STATEMENT_CACHE = 256  # prepared statements kept per connection
+DB_POOL_SIZE = 8  # idle connections kept open per Database
+DB_BATCH_SIZE = 10_000  # rows per executemany call in the *_many methods
+DB_IN_CHUNK = 500  # keys per "IN (?, ...)" lookup, well under SQLite's variable limit
+DB_SUMMARY_TTL = 60.0  # seconds an aggregate (dashboard) result is served from memory
+
 
-@dataclass
+@dataclass(slots=True)
 class ContentRecord:
     """Content generation record"""
     id: Optional[int] = None
@@ -34,11 +61,11 @@ class ContentRecord:
     published_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoRecord:
     """Video render/upload record"""
     id: Optional[int] = None
-    content_id: int = 0
+    content_id: Optional[int] = None  # NULL passes the foreign key check; 0 would not
     video_type: str = ""  # news, writing, vocab_quiz, grammar_quiz, deep_dive
     platform: str = ""    # tiktok, youtube
     local_path: str = ""
@@ -50,7 +77,7 @@ class VideoRecord:
     uploaded_at: Optional[str] = None
 
 
-@dataclass  
+@dataclass(slots=True)
 class AnalyticsRecord:
     """Platform analytics record"""
     id: Optional[int] = None
@@ -66,7 +93,7 @@ class AnalyticsRecord:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriberRecord:
     """Email/Telegram subscriber record"""
     id: Optional[int] = None
@@ -80,30 +107,286 @@ class SubscriberRecord:
     preferences: str = "{}"  # JSON
 
 
+# ==================== SQL ====================
+# Statement text lives in constants so every call reuses the same entry in
+# each pooled connection's prepared-statement cache (DB_STATEMENT_CACHE).
+
+# Record reads select columns in dataclass field order, so a plain tuple row
+# builds the record positionally: Record(*row)
+_CONTENT_COLUMNS = ", ".join(f.name for f in fields(ContentRecord))
+_VIDEO_COLUMNS = ", ".join(f.name for f in fields(VideoRecord))
+_SUBSCRIBER_COLUMNS = ", ".join(f.name for f in fields(SubscriberRecord))
+
+_SQL_UPDATE_CONTENT = """
+    UPDATE content SET 
+        topic_ko=?, topic_vi=?, news_url=?, status=?, 
+        data_json=?, published_at=?
+    WHERE id=?
+"""
+# Upserts update in place (keeping id) rather than INSERT OR REPLACE, which
+# deletes the old row and would break videos.content_id references.
+# RETURNING variants are for single rows; executemany takes the plain ones.
+_SQL_UPSERT_CONTENT = """
+    INSERT INTO content 
+    (date, topic_ko, topic_vi, news_url, status, data_json)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        topic_ko=excluded.topic_ko, topic_vi=excluded.topic_vi,
+        news_url=excluded.news_url, status=excluded.status,
+        data_json=excluded.data_json
+"""
+_SQL_UPSERT_CONTENT_RETURNING = _SQL_UPSERT_CONTENT + "RETURNING id"
+_SQL_CONTENT_BY_DATE = f"SELECT {_CONTENT_COLUMNS} FROM content WHERE date=?"
+_SQL_CONTENTS_BY_DATES = f"SELECT {_CONTENT_COLUMNS} FROM content WHERE date IN ({{}})"
+_SQL_RECENT_CONTENT = f"""
+    SELECT {_CONTENT_COLUMNS} FROM content 
+    ORDER BY date DESC 
+    LIMIT ?
+"""
+_SQL_UPDATE_VIDEO = """
+    UPDATE videos SET 
+        status=?, upload_url=?, video_id=?, uploaded_at=?
+    WHERE id=?
+"""
+_SQL_INSERT_VIDEO = """
+    INSERT INTO videos 
+    (content_id, video_type, platform, local_path, status, duration_sec)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_VIDEOS_BY_CONTENT = f"SELECT {_VIDEO_COLUMNS} FROM videos WHERE content_id=?"
+_SQL_VIDEOS_BY_CONTENTS = f"SELECT {_VIDEO_COLUMNS} FROM videos WHERE content_id IN ({{}}) ORDER BY id"
+_SQL_SAVE_ANALYTICS = """
+    INSERT INTO analytics 
+    (platform, date, followers, views, likes, comments, shares, revenue, engagement_rate)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(platform, date) DO UPDATE SET
+        followers=excluded.followers, views=excluded.views, likes=excluded.likes,
+        comments=excluded.comments, shares=excluded.shares, revenue=excluded.revenue,
+        engagement_rate=excluded.engagement_rate
+"""
+_SQL_ANALYTICS_SUMMARY = """
+    SELECT 
+        platform,
+        SUM(views) as total_views,
+        SUM(likes) as total_likes,
+        SUM(comments) as total_comments,
+        SUM(revenue) as total_revenue,
+        MAX(followers) as current_followers
+    FROM analytics
+    WHERE date >= date('now', ?)
+    GROUP BY platform
+"""
+_SQL_ADD_SUBSCRIBER = """
+    INSERT INTO subscribers 
+    (platform, user_id, name, email, is_premium, preferences)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(platform, user_id) DO UPDATE SET
+        name=excluded.name, email=excluded.email,
+        is_premium=excluded.is_premium, preferences=excluded.preferences
+"""
+_SQL_ADD_SUBSCRIBER_RETURNING = _SQL_ADD_SUBSCRIBER + "RETURNING id"
+_SQL_SUBSCRIBER_COUNT = """
+    SELECT platform, COUNT(*) as count
+    FROM subscribers
+    GROUP BY platform
+"""
+_SQL_PREMIUM_SUBSCRIBERS = f"SELECT {_SUBSCRIBER_COLUMNS} FROM subscribers WHERE is_premium=1"
+_SQL_ADD_REVENUE = """
+    INSERT INTO revenue (date, source, amount, currency, description)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_REVENUE_SUMMARY = """
+    SELECT source, SUM(amount) as total
+    FROM revenue
+    WHERE date >= date('now', ?)
+    GROUP BY source
+"""
+_SQL_TOTAL_REVENUE = """
+    SELECT SUM(amount) as total
+    FROM revenue
+    WHERE date >= date('now', ?)
+"""
+_SQL_INSERT_CONTENT_FILE = """
+    INSERT INTO content_files (content_type, title, file_path, platform)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def _content_params(r: "ContentRecord") -> tuple:
+    return (r.date, r.topic_ko, r.topic_vi, r.news_url, r.status, r.data_json)
+
+
+def _video_params(r: "VideoRecord") -> tuple:
+    return (r.content_id, r.video_type, r.platform, r.local_path, r.status, r.duration_sec)
+
+
+def _analytics_params(r: "AnalyticsRecord") -> tuple:
+    return (r.platform, r.date, r.followers, r.views, r.likes, r.comments,
+            r.shares, r.revenue, r.engagement_rate)
+
+
+def _subscriber_params(r: "SubscriberRecord") -> tuple:
+    return (r.platform, r.user_id, r.name, r.email, 1 if r.is_premium else 0, r.preferences)
+
+
+# ==================== RESULT CACHE ====================
+
+def _ttl_cache(ttl_seconds: float):
+    """
+    Memoize a Database aggregate method per (method, arguments) for ttl_seconds.
+    Writers drop entries with Database._invalidate(); callers get deep copies,
+    so mutating a returned dict never touches the cached value.
+    """
+    def decorator(method):
+        name = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                generation = self._cache_generation[name]
+            if entry is not None and entry[0] > now:
+                return copy.deepcopy(entry[1])
+            
+            value = method(self, *args, **kwargs)
+            with self._cache_lock:
+                # Skip storing if a write invalidated this method meanwhile
+                if self._cache_generation[name] == generation:
+                    self._cache[key] = (now + ttl_seconds, value)
+            return copy.deepcopy(value)
+        
+        return wrapper
+    return decorator
+
+
 class Database:
     """Professional SQLite database manager"""
     
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        # Aggregate results memoized by _ttl_cache: {(method, args, kwargs): (expiry, value)}
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._cache_generation: Dict[str, int] = defaultdict(int)
+        self._cache_lock = threading.Lock()
+        # Idle long-lived connections (warm page cache), most recently used first
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+        atexit.register(self.close)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(DB_JOURNAL_MODE)
+        finally:
+            conn.close()
         self._init_db()
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with DB_PRAGMAS applied (autocommit; transactions are explicit)"""
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE,
+        )
+        conn.executescript(DB_PRAGMAS)
         conn.row_factory = sqlite3.Row
+        return conn
+    
+    @staticmethod
+    def _close(conn: sqlite3.Connection):
+        """Close a connection, letting SQLite re-analyze tables it saw queried heavily"""
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close()
+    
+    @contextmanager
+    def get_connection(self, begin: Optional[str] = "BEGIN"):
+        """
+        Context manager for pooled database connections.
+        
+        The block runs inside `begin` ("BEGIN", or "BEGIN IMMEDIATE" to take
+        the write lock up front) and commits on success. begin=None runs in
+        autocommit: a single statement commits by itself, with no separate
+        BEGIN/COMMIT round-trips.
+        """
         try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            if begin:
+                conn.execute(begin)
             yield conn
             conn.commit()
-        except Exception:
-            conn.rollback()
+        except BaseException:
+            # A connection that failed mid-transaction is not reused
+            try:
+                conn.rollback()
+            finally:
+                self._close(conn)
             raise
-        finally:
-            conn.close()
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            self._close(conn)
+    
+    def close(self):
+        """Close all idle pooled connections (registered with atexit)"""
+        while True:
+            try:
+                self._close(self._pool.get_nowait())
+            except queue.Empty:
+                break
+    
+    def _invalidate(self, *methods: str):
+        """Drop cached results of the named aggregate methods after a write"""
+        with self._cache_lock:
+            for name in methods:
+                self._cache_generation[name] += 1
+            for key in [key for key in self._cache if key[0] in methods]:
+                del self._cache[key]
+    
+    @staticmethod
+    def _tuples(conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        Cursor returning plain tuples (skips sqlite3.Row construction per row).
+        
+        Reads unpack these positionally; plain tuples also beat a namedtuple
+        row factory, which pays a Python-level call per row.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
+    
+    def _select_in(self, sql: str, keys: Iterable) -> List[tuple]:
+        """Run `sql` (with one {} placeholder for the IN list) over keys, DB_IN_CHUNK at a time"""
+        keys = list(dict.fromkeys(keys))  # dedupe, keep order
+        rows: List[tuple] = []
+        with self.get_connection() as conn:
+            cursor = self._tuples(conn)
+            for start in range(0, len(keys), DB_IN_CHUNK):
+                chunk = keys[start:start + DB_IN_CHUNK]
+                rows += cursor.execute(sql.format(",".join("?" * len(chunk))), chunk).fetchall()
+        return rows
+    
+    def _executemany(self, sql: str, rows: Iterable[tuple]) -> int:
+        """Run `sql` for every row in one transaction, DB_BATCH_SIZE rows per call"""
+        rows = iter(rows)
+        count = 0
+        with self.get_connection(begin="BEGIN IMMEDIATE") as conn:
+            while True:
+                chunk = list(islice(rows, DB_BATCH_SIZE))
+                if not chunk:
+                    break
+                conn.executemany(sql, chunk)
+                count += len(chunk)
+        return count
     
     def _init_db(self):
         """Initialize database tables"""
-        with self.get_connection() as conn:
+        with self.get_connection(begin="BEGIN IMMEDIATE") as conn:
             # Content table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS content (
@@ -184,185 +467,206 @@ class Database:
                 )
             """)
             
+            # Generated files table (blog posts, podcasts, ...)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS content_files (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    content_type TEXT NOT NULL,
+                    title TEXT,
+                    file_path TEXT,
+                    platform TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
             # Create indexes
             conn.execute("CREATE INDEX IF NOT EXISTS idx_content_date ON content(date)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_content ON videos(content_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_analytics_date ON analytics(date)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_date ON revenue(date)")
+            
+            # Give the planner real statistics once; later refreshes come from PRAGMA optimize
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'"
+            ).fetchone() and conn.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1").fetchone()
+            if not has_stats:
+                conn.execute("ANALYZE")
     
     # ─── Content Methods ─────────────────────────────────────────────────────
     
     def save_content(self, record: ContentRecord) -> int:
         """Save or update content record"""
-        with self.get_connection() as conn:
+        with self.get_connection(begin=None) as conn:
             if record.id:
-                conn.execute("""
-                    UPDATE content SET 
-                        topic_ko=?, topic_vi=?, news_url=?, status=?, 
-                        data_json=?, published_at=?
-                    WHERE id=?
-                """, (record.topic_ko, record.topic_vi, record.news_url,
+                conn.execute(_SQL_UPDATE_CONTENT, (record.topic_ko, record.topic_vi, record.news_url,
                       record.status, record.data_json, record.published_at, record.id))
                 return record.id
             else:
-                cursor = conn.execute("""
-                    INSERT OR REPLACE INTO content 
-                    (date, topic_ko, topic_vi, news_url, status, data_json)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (record.date, record.topic_ko, record.topic_vi,
-                      record.news_url, record.status, record.data_json))
-                return cursor.lastrowid
+                # lastrowid is not reliable on the update path; RETURNING is
+                return conn.execute(_SQL_UPSERT_CONTENT_RETURNING, _content_params(record)).fetchone()[0]
+    
+    def save_contents_many(self, records: Iterable[ContentRecord]) -> int:
+        """Insert (or update, by date) many content records in one transaction"""
+        return self._executemany(_SQL_UPSERT_CONTENT, map(_content_params, records))
     
     def get_content_by_date(self, date: str) -> Optional[ContentRecord]:
         """Get content for a specific date"""
-        with self.get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM content WHERE date=?", (date,)
-            ).fetchone()
+        with self.get_connection(begin=None) as conn:
+            row = self._tuples(conn).execute(_SQL_CONTENT_BY_DATE, (date,)).fetchone()
             
             if row:
-                return ContentRecord(**dict(row))
+                return ContentRecord(*row)
             return None
     
+    def get_contents_by_dates(self, dates: Iterable[str]) -> Dict[str, ContentRecord]:
+        """Get content for many dates in one query, keyed by date (missing dates omitted)"""
+        records = [ContentRecord(*row) for row in self._select_in(_SQL_CONTENTS_BY_DATES, dates)]
+        return {record.date: record for record in records}
+    
     def get_recent_content(self, days: int = 7) -> List[ContentRecord]:
         """Get recent content records"""
-        with self.get_connection() as conn:
-            rows = conn.execute("""
-                SELECT * FROM content 
-                ORDER BY date DESC 
-                LIMIT ?
-            """, (days,)).fetchall()
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_RECENT_CONTENT, (days,)).fetchall()
             
-            return [ContentRecord(**dict(row)) for row in rows]
+            return [ContentRecord(*row) for row in rows]
+    
+    def insert_content(self, content_type: str, title: str = "",
+                       file_path: str = "", platform: str = "") -> int:
+        """Record a generated content file"""
+        with self.get_connection(begin=None) as conn:
+            cursor = conn.execute(_SQL_INSERT_CONTENT_FILE, (content_type, title, file_path, platform))
+            return cursor.lastrowid
+    
+    def insert_content_many(self, rows: List[Tuple[str, str, str, str]]) -> int:
+        """Record many (content_type, title, file_path, platform) rows in one transaction"""
+        return self._executemany(_SQL_INSERT_CONTENT_FILE, rows)
     
     # ─── Video Methods ───────────────────────────────────────────────────────
     
     def save_video(self, record: VideoRecord) -> int:
         """Save video record"""
-        with self.get_connection() as conn:
+        with self.get_connection(begin=None) as conn:
             if record.id:
-                conn.execute("""
-                    UPDATE videos SET 
-                        status=?, upload_url=?, video_id=?, uploaded_at=?
-                    WHERE id=?
-                """, (record.status, record.upload_url, record.video_id,
+                conn.execute(_SQL_UPDATE_VIDEO, (record.status, record.upload_url, record.video_id,
                       record.uploaded_at, record.id))
                 return record.id
             else:
-                cursor = conn.execute("""
-                    INSERT INTO videos 
-                    (content_id, video_type, platform, local_path, status, duration_sec)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (record.content_id, record.video_type, record.platform,
-                      record.local_path, record.status, record.duration_sec))
+                cursor = conn.execute(_SQL_INSERT_VIDEO, _video_params(record))
                 return cursor.lastrowid
     
+    def save_videos_many(self, records: Iterable[VideoRecord]) -> int:
+        """Insert many new video records in one transaction"""
+        return self._executemany(_SQL_INSERT_VIDEO, map(_video_params, records))
+    
     def get_videos_by_content(self, content_id: int) -> List[VideoRecord]:
         """Get all videos for a content record"""
-        with self.get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM videos WHERE content_id=?", (content_id,)
-            ).fetchall()
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_VIDEOS_BY_CONTENT, (content_id,)).fetchall()
             
-            return [VideoRecord(**dict(row)) for row in rows]
+            return [VideoRecord(*row) for row in rows]
+    
+    def get_videos_by_contents(self, content_ids: Iterable[int]) -> Dict[int, List[VideoRecord]]:
+        """Get videos for many content records in one query, grouped by content_id"""
+        videos: Dict[int, List[VideoRecord]] = defaultdict(list)
+        for row in self._select_in(_SQL_VIDEOS_BY_CONTENTS, content_ids):
+            record = VideoRecord(*row)
+            videos[record.content_id].append(record)
+        return dict(videos)
     
     # ─── Analytics Methods ───────────────────────────────────────────────────
     
     def save_analytics(self, record: AnalyticsRecord):
         """Save analytics record"""
-        with self.get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO analytics 
-                (platform, date, followers, views, likes, comments, shares, revenue, engagement_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (record.platform, record.date, record.followers, record.views,
-                  record.likes, record.comments, record.shares, 
-                  record.revenue, record.engagement_rate))
+        with self.get_connection(begin=None) as conn:
+            conn.execute(_SQL_SAVE_ANALYTICS, _analytics_params(record))
+        self._invalidate("get_analytics_summary")
     
+    def save_analytics_many(self, records: Iterable[AnalyticsRecord]) -> int:
+        """Save many analytics records in one transaction"""
+        count = self._executemany(_SQL_SAVE_ANALYTICS, map(_analytics_params, records))
+        self._invalidate("get_analytics_summary")
+        return count
+    
+    @_ttl_cache(DB_SUMMARY_TTL)
     def get_analytics_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get analytics summary across all platforms"""
-        with self.get_connection() as conn:
-            rows = conn.execute("""
-                SELECT 
-                    platform,
-                    SUM(views) as total_views,
-                    SUM(likes) as total_likes,
-                    SUM(comments) as total_comments,
-                    SUM(revenue) as total_revenue,
-                    MAX(followers) as current_followers
-                FROM analytics
-                WHERE date >= date('now', ?)
-                GROUP BY platform
-            """, (f'-{days} days',)).fetchall()
-            
-            return {row['platform']: dict(row) for row in rows}
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_ANALYTICS_SUMMARY, (f'-{days} days',)).fetchall()
+        
+        return {
+            platform: {
+                "platform": platform,
+                "total_views": views,
+                "total_likes": likes,
+                "total_comments": comments,
+                "total_revenue": revenue,
+                "current_followers": followers,
+            }
+            for platform, views, likes, comments, revenue, followers in rows
+        }
     
     # ─── Subscriber Methods ──────────────────────────────────────────────────
     
     def add_subscriber(self, record: SubscriberRecord) -> int:
         """Add or update subscriber"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO subscribers 
-                (platform, user_id, name, email, is_premium, preferences)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (record.platform, record.user_id, record.name, record.email,
-                  1 if record.is_premium else 0, record.preferences))
-            return cursor.lastrowid
+        with self.get_connection(begin=None) as conn:
+            (subscriber_id,) = conn.execute(
+                _SQL_ADD_SUBSCRIBER_RETURNING, _subscriber_params(record)
+            ).fetchone()
+        self._invalidate("get_subscriber_count")
+        return subscriber_id
     
+    def add_subscribers_many(self, records: Iterable[SubscriberRecord]) -> int:
+        """Add or update many subscribers in one transaction"""
+        count = self._executemany(_SQL_ADD_SUBSCRIBER, map(_subscriber_params, records))
+        self._invalidate("get_subscriber_count")
+        return count
+    
+    @_ttl_cache(DB_SUMMARY_TTL)
     def get_subscriber_count(self) -> Dict[str, int]:
         """Get subscriber count by platform"""
-        with self.get_connection() as conn:
-            rows = conn.execute("""
-                SELECT platform, COUNT(*) as count
-                FROM subscribers
-                GROUP BY platform
-            """).fetchall()
-            
-            return {row['platform']: row['count'] for row in rows}
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_SUBSCRIBER_COUNT).fetchall()
+        
+        return dict(rows)
     
     def get_premium_subscribers(self) -> List[SubscriberRecord]:
         """Get all premium subscribers"""
-        with self.get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM subscribers WHERE is_premium=1"
-            ).fetchall()
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_PREMIUM_SUBSCRIBERS).fetchall()
             
-            return [SubscriberRecord(**dict(row)) for row in rows]
+            return [SubscriberRecord(*row) for row in rows]
     
     # ─── Revenue Methods ─────────────────────────────────────────────────────
     
     def add_revenue(self, date: str, source: str, amount: float, 
                     currency: str = "USD", description: str = ""):
         """Add revenue entry"""
-        with self.get_connection() as conn:
-            conn.execute("""
-                INSERT INTO revenue (date, source, amount, currency, description)
-                VALUES (?, ?, ?, ?, ?)
-            """, (date, source, amount, currency, description))
+        with self.get_connection(begin=None) as conn:
+            conn.execute(_SQL_ADD_REVENUE, (date, source, amount, currency, description))
+        self._invalidate("get_revenue_summary", "get_total_revenue")
     
+    def add_revenue_many(self, rows: Iterable[Tuple[str, str, float, str, str]]) -> int:
+        """Add many (date, source, amount, currency, description) entries in one transaction"""
+        count = self._executemany(_SQL_ADD_REVENUE, rows)
+        self._invalidate("get_revenue_summary", "get_total_revenue")
+        return count
+    
+    @_ttl_cache(DB_SUMMARY_TTL)
     def get_revenue_summary(self, days: int = 30) -> Dict[str, float]:
         """Get revenue summary by source"""
-        with self.get_connection() as conn:
-            rows = conn.execute("""
-                SELECT source, SUM(amount) as total
-                FROM revenue
-                WHERE date >= date('now', ?)
-                GROUP BY source
-            """, (f'-{days} days',)).fetchall()
-            
-            return {row['source']: row['total'] for row in rows}
+        with self.get_connection(begin=None) as conn:
+            rows = self._tuples(conn).execute(_SQL_REVENUE_SUMMARY, (f'-{days} days',)).fetchall()
+        
+        return dict(rows)
     
+    @_ttl_cache(DB_SUMMARY_TTL)
     def get_total_revenue(self, days: int = 30) -> float:
         """Get total revenue"""
-        with self.get_connection() as conn:
-            row = conn.execute("""
-                SELECT SUM(amount) as total
-                FROM revenue
-                WHERE date >= date('now', ?)
-            """, (f'-{days} days',)).fetchone()
-            
-            return row['total'] or 0.0
+        with self.get_connection(begin=None) as conn:
+            (total,) = self._tuples(conn).execute(_SQL_TOTAL_REVENUE, (f'-{days} days',)).fetchone()
+        
+        return total or 0.0
 
 
 # Singleton instance
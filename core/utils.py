@@ -17,8 +17,42 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Callable, TypeVar
 from functools import wraps
 
+# orjson parses 2-5x faster than stdlib json; both accept str or bytes
+try:
+    import orjson
+    json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps_bytes(data: Any, indent: int = 2) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes (non-ASCII kept as-is, like ensure_ascii=False).
+    orjson only supports 2-space indentation; other indents use stdlib json.
+    """
+    if ORJSON_AVAILABLE and indent == 2:
+        # OPT_NON_STR_KEYS: int/float keys become strings, as json.dumps does
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
 T = TypeVar('T')
 
+# hashlib.file_digest (3.11+) hashes from a C-level read buffer, no per-chunk Python loop
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Patterns compiled once at import instead of going through re's cache on every call
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+# \s stays Unicode-aware: U+3000 / NBSP occur in Korean text and are invalid in URLs
+_KO_SENT_RE = re.compile(r'(?<=[.?!。！？])\s+')
+_EN_SENT_RE = re.compile(r'(?<=[.?!])\s+')
+_KO_WORD_RE = re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]+')
+_KO_CHAR_RE = re.compile(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', re.ASCII)
+_URL_RE = re.compile(r'^https?://[^\s<>"{}|\\^`\[\]]+$')
+
 
 # ─── File Operations ─────────────────────────────────────────────────────────
 
@@ -27,8 +61,7 @@ def safe_json_load(filepath: str | Path, default: Any = None) -> Any:
     try:
         path = Path(filepath)
         if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_loads(path.read_bytes())
     except (json.JSONDecodeError, IOError) as e:
         print(f"⚠️ Error loading {filepath}: {e}")
     return default if default is not None else {}
@@ -40,8 +73,7 @@ def safe_json_save(data: Any, filepath: str | Path, indent: int = 2) -> bool:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
+        path.write_bytes(json_dumps_bytes(data, indent))
         return True
     except IOError as e:
         print(f"❌ Error saving {filepath}: {e}")
@@ -68,12 +100,13 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
     Sanitize filename by removing/replacing invalid characters.
     Safe for Windows, macOS, and Linux.
     """
-    # Normalize unicode characters
-    filename = unicodedata.normalize('NFKD', filename)
+    # Normalize unicode characters (ASCII is already NFKD-normal)
+    if not filename.isascii():
+        filename = unicodedata.normalize('NFKD', filename)
     
     # Remove or replace invalid characters
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    filename = re.sub(invalid_chars, '_', filename)
+    # (compiled regex beats a str.translate table here: translate falls back to per-char dict lookups)
+    filename = _INVALID_CHARS_RE.sub('_', filename)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
@@ -88,9 +121,11 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
 
 def get_file_hash(filepath: str | Path, algorithm: str = "md5") -> str:
     """Calculate file hash for deduplication"""
-    hash_func = hashlib.new(algorithm)
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
+        if _HAS_FILE_DIGEST:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        hash_func = hashlib.new(algorithm)
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
             hash_func.update(chunk)
     return hash_func.hexdigest()
 
@@ -106,20 +141,15 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
 
 def clean_text(text: str) -> str:
     """Clean text by removing extra whitespace"""
-    # Remove multiple spaces/newlines
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Collapse runs of whitespace (same Unicode set as \s) and trim the ends
+    return ' '.join(text.split())
 
 
 def extract_sentences(text: str, lang: str = "ko") -> List[str]:
     """Split text into sentences"""
-    if lang == "ko":
-        # Korean sentence endings
-        pattern = r'(?<=[.?!。！？])\s+'
-    else:
-        pattern = r'(?<=[.?!])\s+'
-    
-    sentences = re.split(pattern, text)
+    # Korean also ends sentences with full-width punctuation
+    pattern = _KO_SENT_RE if lang == "ko" else _EN_SENT_RE
+    sentences = pattern.split(text)
     return [s.strip() for s in sentences if s.strip()]
 
 
@@ -127,7 +157,7 @@ def count_words(text: str, lang: str = "ko") -> int:
     """Count words in text"""
     if lang == "ko":
         # Korean: count by syllables/characters (excluding spaces)
-        return len(re.findall(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]+', text))
+        return len(_KO_WORD_RE.findall(text))
     else:
         return len(text.split())
 
@@ -154,15 +184,18 @@ def format_duration(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+# (threshold, suffix), largest first
+_NUMBER_TIERS = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+
 def format_number(num: int | float, precision: int = 1) -> str:
     """Format large numbers with K, M, B suffixes"""
-    if num >= 1_000_000_000:
-        return f"{num / 1_000_000_000:.{precision}f}B"
-    elif num >= 1_000_000:
-        return f"{num / 1_000_000:.{precision}f}M"
-    elif num >= 1_000:
-        return f"{num / 1_000:.{precision}f}K"
-    return str(int(num))
+    if num < 1_000:
+        return str(int(num))
+    for threshold, suffix in _NUMBER_TIERS:
+        if num >= threshold:
+            return f"{num / threshold:.{precision}f}{suffix}"
+    return str(int(num))  # only NaN gets here (fails every comparison), as before
 
 
 def get_date_range(days: int = 7) -> List[str]:
@@ -174,18 +207,39 @@ def get_date_range(days: int = 7) -> List[str]:
     ]
 
 
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+# Common shapes of _DATE_FORMATS in one match: Y-m-d[(T| )H:M:S], Y/m/d, d-m-Y, d/m/Y
+_DATE_RE = re.compile(
+    r'(?P<y>[0-9]{4})(?P<sep>[-/])(?P<mo>[0-9]{1,2})(?P=sep)(?P<d>[0-9]{1,2})'
+    r'(?:[T ](?P<h>[0-9]{2}):(?P<mi>[0-9]{2}):(?P<s>[0-9]{2}))?'
+    r'|(?P<dd>[0-9]{1,2})(?P<sep2>[-/])(?P<mm>[0-9]{1,2})(?P=sep2)(?P<yy>[0-9]{4})'
+)
+
+
 def parse_date(date_str: str) -> Optional[datetime]:
     """Parse date string to datetime object"""
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-    ]
+    # Fast path: build the datetime straight from the regex groups.
+    # Anything else (out-of-range fields, Y/m/d with a time, looser strptime spellings)
+    # goes through strptime, which stays the reference behaviour.
+    m = _DATE_RE.fullmatch(date_str)
+    if m and not (m['h'] and m['sep'] == '/'):
+        try:
+            if m['y']:
+                return datetime(int(m['y']), int(m['mo']), int(m['d']),
+                                int(m['h'] or 0), int(m['mi'] or 0), int(m['s'] or 0))
+            return datetime(int(m['yy']), int(m['mm']), int(m['dd']))
+        except ValueError:
+            pass
     
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -269,23 +323,25 @@ class RateLimiter:
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_url(url: str) -> bool:
     """Validate URL format"""
-    pattern = r'^https?://[^\s<>"{}|\\^`\[\]]+$'
-    return bool(re.match(pattern, url))
+    return bool(_URL_RE.match(url))
 
 
 def validate_korean_text(text: str) -> bool:
     """Check if text contains Korean characters"""
-    return bool(re.search(r'[\uAC00-\uD7AF\u1100-\u11FF\u3130-\u318F]', text))
+    return bool(_KO_CHAR_RE.search(text))
 
 
 # ─── Korean Language Helpers ─────────────────────────────────────────────────
 
+# _HAS_FINAL[i] is 1 iff U+AC00+i has a 받침 ((i % 28) != 0), over the U+AC00-U+D7AF range
+_HAS_FINAL = bytes(1 if i % 28 else 0 for i in range(0xD7AF - 0xAC00 + 1))
+
+
 def get_korean_particle(word: str, particle_with_final: str, particle_without_final: str) -> str:
     """
     Get correct Korean particle based on 받침 (final consonant).
@@ -297,43 +353,36 @@ def get_korean_particle(word: str, particle_with_final: str, particle_without_fi
     if not word:
         return particle_with_final
     
-    last_char = word[-1]
-    
-    # Check if it's a Korean syllable
-    if '\uAC00' <= last_char <= '\uD7AF':
-        # Calculate if it has final consonant (받침)
-        code = ord(last_char) - 0xAC00
-        has_final = (code % 28) != 0
-        return particle_without_final if has_final else particle_with_final
+    # Korean syllable with a final consonant (받침)? — one table lookup, no modulo
+    code = ord(word[-1]) - 0xAC00
+    if 0 <= code < len(_HAS_FINAL) and _HAS_FINAL[code]:
+        return particle_without_final
     
     return particle_with_final
 
 
+# Compatibility jamo -> Latin, applied in one str.translate pass
+# ('ㅇ' maps to '' and is deleted; full syllables are not in the table and pass through)
+_ROMANIZATION_TABLE = str.maketrans({
+    'ㄱ': 'g', 'ㄴ': 'n', 'ㄷ': 'd', 'ㄹ': 'r', 'ㅁ': 'm',
+    'ㅂ': 'b', 'ㅅ': 's', 'ㅇ': '', 'ㅈ': 'j', 'ㅊ': 'ch',
+    'ㅋ': 'k', 'ㅌ': 't', 'ㅍ': 'p', 'ㅎ': 'h',
+    'ㅏ': 'a', 'ㅓ': 'eo', 'ㅗ': 'o', 'ㅜ': 'u', 'ㅡ': 'eu',
+    'ㅣ': 'i', 'ㅐ': 'ae', 'ㅔ': 'e', 'ㅚ': 'oe', 'ㅟ': 'wi',
+})
+
+
 def romanize_korean(text: str) -> str:
     """
     Simple romanization of Korean text (basic conversion).
     For production, use a proper library like korean-romanizer.
     """
-    # This is a simplified version - use a proper library for accuracy
-    romanization_map = {
-        'ㄱ': 'g', 'ㄴ': 'n', 'ㄷ': 'd', 'ㄹ': 'r', 'ㅁ': 'm',
-        'ㅂ': 'b', 'ㅅ': 's', 'ㅇ': '', 'ㅈ': 'j', 'ㅊ': 'ch',
-        'ㅋ': 'k', 'ㅌ': 't', 'ㅍ': 'p', 'ㅎ': 'h',
-        'ㅏ': 'a', 'ㅓ': 'eo', 'ㅗ': 'o', 'ㅜ': 'u', 'ㅡ': 'eu',
-        'ㅣ': 'i', 'ㅐ': 'ae', 'ㅔ': 'e', 'ㅚ': 'oe', 'ㅟ': 'wi',
-    }
-    
-    result = []
-    for char in text:
-        if char in romanization_map:
-            result.append(romanization_map[char])
-        elif '\uAC00' <= char <= '\uD7AF':
-            # For full syllables, just keep original for now
-            result.append(char)
-        else:
-            result.append(char)
+    # Nothing to romanize in pure-ASCII text
+    if text.isascii():
+        return text
     
-    return ''.join(result)
+    # This is a simplified version - use a proper library for accuracy
+    return text.translate(_ROMANIZATION_TABLE)
 
 
 # ─── Progress Tracking ───────────────────────────────────────────────────────
@@ -20,6 +20,19 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+# orjson parses raw bytes directly; stdlib json.loads also accepts bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 # ==================== CONFIGURATION ====================
 COURSES_DIR = Path("courses")
 COURSES_DIR.mkdir(exist_ok=True)
@@ -145,6 +158,15 @@ class CourseGenerator:
         course_dir = self.output_dir / output_name
         course_dir.mkdir(exist_ok=True)
         
+        # One pass over the curriculum for all statistics
+        modules = template["modules"]
+        total_lessons = 0
+        total_quizzes = 0
+        for module in modules:
+            lessons = module["lessons"]
+            total_lessons += len(lessons)
+            total_quizzes += sum(1 for l in lessons if l["type"] == "quiz")
+        
         # Create course structure
         course_data = {
             "meta": {
@@ -154,18 +176,18 @@ class CourseGenerator:
                 "duration_weeks": template["duration_weeks"],
                 "created_at": datetime.now().isoformat(),
             },
-            "modules": template["modules"],
+            "modules": modules,
             "statistics": {
-                "total_modules": len(template["modules"]),
-                "total_lessons": sum(len(m["lessons"]) for m in template["modules"]),
-                "total_quizzes": sum(1 for m in template["modules"] for l in m["lessons"] if l["type"] == "quiz"),
+                "total_modules": len(modules),
+                "total_lessons": total_lessons,
+                "total_quizzes": total_quizzes,
             }
         }
         
         # Save course JSON
         course_file = course_dir / "course.json"
-        with open(course_file, "w", encoding="utf-8") as f:
-            json.dump(course_data, f, ensure_ascii=False, indent=2)
+        with open(course_file, "wb") as f:
+            f.write(_json_dumps_bytes(course_data))
         
         # Create module directories
         for module in template["modules"]:
@@ -180,8 +202,8 @@ class CourseGenerator:
                 "lessons": module["lessons"],
             }
             
-            with open(module_dir / "module.json", "w", encoding="utf-8") as f:
-                json.dump(module_info, f, ensure_ascii=False, indent=2)
+            with open(module_dir / "module.json", "wb") as f:
+                f.write(_json_dumps_bytes(module_info))
         
         logging.info(f"✅ Generated course: {output_name}")
         return str(course_dir)
@@ -199,8 +221,8 @@ class CourseGenerator:
         
         for content_file in content_files:
             if os.path.exists(content_file):
-                with open(content_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(content_file, "rb") as f:
+                    data = _json_loads(f.read())
                 
                 all_vocabulary.extend(data.get("vocabulary", []))
                 all_grammar.extend(data.get("grammar", []))
@@ -211,14 +233,13 @@ class CourseGenerator:
                 if "video_4" in data:
                     all_quizzes.append(data["video_4"])
         
-        # Remove duplicates
-        seen_vocab = set()
-        unique_vocab = []
+        # Remove duplicates (first occurrence wins; dict keeps insertion order)
+        vocab_by_korean = {}
         for v in all_vocabulary:
             key = v.get("korean", "")
-            if key and key not in seen_vocab:
-                seen_vocab.add(key)
-                unique_vocab.append(v)
+            if key:
+                vocab_by_korean.setdefault(key, v)
+        unique_vocab = list(vocab_by_korean.values())
         
         # Create modules (group by 20 vocabulary items)
         modules = []
@@ -272,8 +293,8 @@ class CourseGenerator:
         
         # Save
         course_file = course_dir / "course.json"
-        with open(course_file, "w", encoding="utf-8") as f:
-            json.dump(course_data, f, ensure_ascii=False, indent=2)
+        with open(course_file, "wb") as f:
+            f.write(_json_dumps_bytes(course_data))
         
         logging.info(f"✅ Generated course from {len(content_files)} content files")
         return str(course_dir)
@@ -288,8 +309,8 @@ class CourseGenerator:
             logging.error(f"❌ Course not found: {course_file}")
             return {}
         
-        with open(course_file, "r", encoding="utf-8") as f:
-            course = json.load(f)
+        with open(course_file, "rb") as f:
+            course = _json_loads(f.read())
         
         # Udemy format
         udemy_course = {
@@ -300,29 +321,27 @@ class CourseGenerator:
             "course_level": course["meta"]["level"],
             "course_category": "Language Learning",
             "course_subcategory": "Korean",
-            "sections": [],
-        }
-        
-        for module in course.get("modules", []):
-            section = {
-                "title": module["title"],
-                "lectures": [],
-            }
-            
-            for lesson in module.get("lessons", []):
-                lecture = {
-                    "title": lesson["title"],
-                    "type": "video" if lesson["type"] == "video" else "article",
-                    "description": "",
+            # Sections and lectures built in a single nested pass
+            "sections": [
+                {
+                    "title": module["title"],
+                    "lectures": [
+                        {
+                            "title": lesson["title"],
+                            "type": "video" if lesson["type"] == "video" else "article",
+                            "description": "",
+                        }
+                        for lesson in module.get("lessons", [])
+                    ],
                 }
-                section["lectures"].append(lecture)
-            
-            udemy_course["sections"].append(section)
+                for module in course.get("modules", [])
+            ],
+        }
         
         # Save Udemy format
         udemy_file = course_path / "udemy_export.json"
-        with open(udemy_file, "w", encoding="utf-8") as f:
-            json.dump(udemy_course, f, ensure_ascii=False, indent=2)
+        with open(udemy_file, "wb") as f:
+            f.write(_json_dumps_bytes(udemy_course))
         
         logging.info(f"✅ Exported to Udemy format: {udemy_file}")
         return udemy_course
@@ -48,6 +48,11 @@ LONG_TAIL_KEYWORDS = [
     "tin tức Hàn Quốc song ngữ",
 ]
 
+# Precompiled patterns for content optimization (compiled once at import)
+_H1_RE = re.compile(r'#\s+')
+_H2_RE = re.compile(r'##\s+')
+_LINK_RE = re.compile(r'\[.*?\]\(.*?\)')
+
 
 class SEOOptimizer:
     """
@@ -257,40 +262,7 @@ Allow: /
     
     def optimize_content(self, content: str, target_keyword: str) -> str:
         """Optimize content for target keyword"""
-        
-        # Check keyword density (aim for 1-2%)
-        word_count = len(content.split())
-        keyword_count = content.lower().count(target_keyword.lower())
-        density = (keyword_count / word_count) * 100 if word_count > 0 else 0
-        
-        # Suggestions
-        suggestions = []
-        
-        if density < 0.5:
-            suggestions.append(f"⚠️ Keyword '{target_keyword}' density too low ({density:.1f}%). Add more mentions.")
-        elif density > 3:
-            suggestions.append(f"⚠️ Keyword '{target_keyword}' density too high ({density:.1f}%). Reduce to avoid spam.")
-        else:
-            suggestions.append(f"✅ Keyword density OK ({density:.1f}%)")
-        
-        # Check for heading structure
-        if not re.search(r'#\s+', content):
-            suggestions.append("⚠️ No H1 heading found. Add main title with #")
-        
-        if not re.search(r'##\s+', content):
-            suggestions.append("⚠️ No H2 headings found. Add subheadings with ##")
-        
-        # Check for links
-        if not re.search(r'\[.*?\]\(.*?\)', content):
-            suggestions.append("⚠️ No links found. Add internal/external links.")
-        
-        # Check content length
-        if word_count < 300:
-            suggestions.append(f"⚠️ Content too short ({word_count} words). Aim for 1000+ words.")
-        elif word_count >= 1000:
-            suggestions.append(f"✅ Content length OK ({word_count} words)")
-        
-        return "\n".join(suggestions)
+        return optimize_content_pure(content, target_keyword)
     
     def suggest_internal_links(self, current_post: Dict, all_posts: List[Dict]) -> List[Dict]:
         """Suggest internal links to other relevant posts"""
@@ -436,6 +408,53 @@ class KeywordResearcher:
 
 # ==================== UTILITY FUNCTIONS ====================
 
+def optimize_content_pure(content: str, target_keyword: str = "TOPIK") -> str:
+    """Optimize content for target keyword (pure function, safe for worker processes)"""
+    
+    # Check keyword density (aim for 1-2%)
+    word_count = len(content.split())
+    keyword_count = content.lower().count(target_keyword.lower())
+    density = (keyword_count / word_count) * 100 if word_count > 0 else 0
+    
+    # Suggestions
+    suggestions = []
+    
+    if density < 0.5:
+        suggestions.append(f"⚠️ Keyword '{target_keyword}' density too low ({density:.1f}%). Add more mentions.")
+    elif density > 3:
+        suggestions.append(f"⚠️ Keyword '{target_keyword}' density too high ({density:.1f}%). Reduce to avoid spam.")
+    else:
+        suggestions.append(f"✅ Keyword density OK ({density:.1f}%)")
+    
+    # Check for heading structure
+    if not _H1_RE.search(content):
+        suggestions.append("⚠️ No H1 heading found. Add main title with #")
+    
+    if not _H2_RE.search(content):
+        suggestions.append("⚠️ No H2 headings found. Add subheadings with ##")
+    
+    # Check for links
+    if not _LINK_RE.search(content):
+        suggestions.append("⚠️ No links found. Add internal/external links.")
+    
+    # Check content length
+    if word_count < 300:
+        suggestions.append(f"⚠️ Content too short ({word_count} words). Aim for 1000+ words.")
+    elif word_count >= 1000:
+        suggestions.append(f"✅ Content length OK ({word_count} words)")
+    
+    return "\n".join(suggestions)
+
+
+def optimize_post_file(path: str, target_keyword: str = "TOPIK") -> Dict[str, str]:
+    """Read a markdown post and return its SEO suggestions"""
+    
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    
+    return {"file": os.path.basename(path), "suggestions": optimize_content_pure(content, target_keyword)}
+
+
 def optimize_blog_post(data_file: str = "topik-video/public/final_data.json") -> Dict:
     """Optimize a blog post for SEO"""
     
@@ -472,14 +472,47 @@ Liên hệ @topikdaily để đăng ký!
 
 # ==================== SCHEDULED PUSH ====================
 
+# Bot instances cached per token so the HTTP session stays warm between pushes.
+# Only valid when callers reuse the same event loop (see automation/scheduler.py run_coro).
+_BOTS: Dict[str, "Bot"] = {}
+
+
+async def get_bot(bot_token: str = BOT_TOKEN):
+    """Return an initialized Bot for this token, reusing its HTTP session"""
+    bot = _BOTS.get(bot_token)
+    if bot is None:
+        from telegram import Bot
+        
+        bot = Bot(token=bot_token)
+        await bot.initialize()
+        _BOTS[bot_token] = bot
+    return bot
+
+
+async def send_message_to_channel(text: str, channel_id: Optional[str] = None, bot_token: str = BOT_TOKEN):
+    """Send a Markdown message to the channel"""
+    if not TELEGRAM_BOT_AVAILABLE:
+        return
+    
+    channel_id = channel_id or os.getenv("TELEGRAM_CHANNEL_ID", "")
+    if not channel_id:
+        logging.warning("⚠️ TELEGRAM_CHANNEL_ID not set")
+        return
+    
+    bot = await get_bot(bot_token)
+    await bot.send_message(
+        chat_id=channel_id,
+        text=text,
+        parse_mode="Markdown"
+    )
+
+
 async def send_daily_push(bot_token: str, channel_id: str, data_file: str):
     """Send daily lesson to channel (called from cron)"""
     if not TELEGRAM_BOT_AVAILABLE:
         return
     
-    from telegram import Bot
-    
-    bot = Bot(token=bot_token)
+    bot = await get_bot(bot_token)
     
     # Load data
     with open(data_file, "r", encoding="utf-8") as f:
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+TOPIK DAILY - BLOG GENERATOR TESTER
+================================================================================
+Kiểm tra blog_generator_v2 trên thư mục output tạm:
+1. Dữ liệu (tin tức, từ vựng, quiz) bắt đầu bằng "<" phải được escape trong HTML
+2. Các dòng HTML của template (vocab-item, quiz-section, details) vẫn giữ nguyên
+
+Usage:
+    python test_blog_generator.py
+    python -m pytest test_blog_generator.py
+================================================================================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Fix encoding for Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+from blog_generator_v2 import BlogGenerator
+
+
+def ok(msg): print(f"  [OK] {msg}")
+def fail(msg): print(f"  [FAIL] {msg}")
+def header(msg): print(f"\n{'='*60}\n{msg}\n{'='*60}")
+
+
+SCRIPT = "<script>alert(1)</script>"
+IMG = "<img src=x onerror=alert(1)>"
+
+XSS_DATA = {
+    "meta": {"topic_title_vi": "Kiểm tra"},
+    "phase1": {"news_summary_easy_kr": SCRIPT, "news_summary_easy_vi": "Tin tức"},
+    "phase2": {
+        "essay": "본문",
+        "analysis_list": [{"item": IMG, "professor_explanation": SCRIPT}],
+    },
+    "phase3": {
+        "video_3_vocab_quiz": {
+            "target_word": "단어",
+            "question_vi": "Câu hỏi?",
+            "options_vi": ["A", "B"],
+            "correct_answer": "A",
+            "explanation_vi": SCRIPT,
+        },
+    },
+}
+
+
+def _render_post(data: dict) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = BlogGenerator(output_dir=tmp)
+        generator.setup_directories()
+        post = generator.generate_post(data, "2024-01-01")
+        return Path(post.html_path).read_text(encoding="utf-8")
+
+
+# ==================== TEST FUNCTIONS ====================
+
+def test_post_data_is_escaped():
+    """<script> trong tin tức và <img> trong từ vựng được escape, không chạy được"""
+    html = _render_post(XSS_DATA)
+    assert SCRIPT not in html
+    assert IMG not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert '<strong class="korean-text">1. &lt;img src=x onerror=alert(1)&gt;</strong>' in html
+
+
+def test_template_html_lines_kept():
+    """Các dòng HTML của template vẫn được render nguyên dạng"""
+    html = _render_post(XSS_DATA)
+    for line in ('<div class="vocab-item">', '<div class="quiz-section">',
+                 '<details>', '<summary>👁️ Xem đáp án</summary>', '</details>'):
+        assert line in html, line
+
+
+def main():
+    header("TEST BLOG GENERATOR")
+    failed = 0
+    for test in (test_post_data_is_escaped, test_template_html_lines_kept):
+        try:
+            test()
+            ok(test.__doc__)
+        except Exception as e:
+            failed += 1
+            fail(f"{test.__doc__}: {type(e).__name__}: {e}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+================================================================================
+TOPIK DAILY - DATABASE TESTER
+================================================================================
+Kiểm tra hành vi của core.database trên một file SQLite tạm:
+1. VideoRecord mặc định (chưa gắn content) lưu được khi bật foreign_keys
+2. Lưu lại content cùng ngày (UPSERT) giữ nguyên id và các video đã gắn
+
+Usage:
+    python test_database.py
+    python -m pytest test_database.py
+================================================================================
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Fix encoding for Windows
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+from core.database import Database, ContentRecord, VideoRecord
+
+
+def ok(msg): print(f"  [OK] {msg}")
+def fail(msg): print(f"  [FAIL] {msg}")
+def header(msg): print(f"\n{'='*60}\n{msg}\n{'='*60}")
+
+
+# ==================== TEST FUNCTIONS ====================
+
+def test_video_without_content():
+    """VideoRecord() mặc định có content_id=None — NULL qua được FOREIGN KEY"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "test.db")
+        try:
+            video_id = db.save_video(VideoRecord(video_type="news", platform="tiktok"))
+            assert video_id, "save_video returned no id"
+            assert db.get_videos_by_content(None) == []  # content_id=NULL never matches '='
+        finally:
+            db.close()
+
+
+def test_upsert_keeps_id_and_videos():
+    """save_content cùng ngày cập nhật tại chỗ: id không đổi, video không mất"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "test.db")
+        try:
+            content_id = db.save_content(ContentRecord(date="2024-01-01", topic_ko="첫 주제"))
+            db.save_video(VideoRecord(content_id=content_id, video_type="news", platform="youtube"))
+
+            resaved_id = db.save_content(ContentRecord(date="2024-01-01", topic_ko="새 주제", status="generated"))
+            assert resaved_id == content_id, f"id changed: {content_id} -> {resaved_id}"
+
+            content = db.get_content_by_date("2024-01-01")
+            assert content.id == content_id
+            assert content.topic_ko == "새 주제"
+            assert content.status == "generated"
+
+            videos = db.get_videos_by_content(content_id)
+            assert [(v.video_type, v.platform) for v in videos] == [("news", "youtube")]
+        finally:
+            db.close()
+
+
+def main():
+    header("TEST DATABASE")
+    failed = 0
+    for test in (test_video_without_content, test_upsert_keeps_id_and_videos):
+        try:
+            test()
+            ok(test.__doc__)
+        except Exception as e:
+            failed += 1
+            fail(f"{test.__doc__}: {type(e).__name__}: {e}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()